@@ -8,7 +8,7 @@ from utils.ui_helpers import draw_game_over_screen
 
 
 # Word list
-WORDS = [
+_RAW_WORDS = [
     'python', 'computer', 'terminal', 'game', 'curses', 'programming',
     'algorithm', 'function', 'variable', 'string', 'integer', 'boolean',
     'dictionary', 'list', 'tuple', 'class', 'object', 'method', 'module',
@@ -18,6 +18,17 @@ WORDS = [
     'compile', 'debug', 'error', 'exception', 'syntax', 'semantic', 'logic'
 ]
 
+# Upper-cased once at import so picking a word needs no conversion
+WORDS = tuple(word.upper() for word in _RAW_WORDS)
+
+_randrange = random.randrange
+
+# Screen rows: the figure, the word (guess info goes below it) and the
+# instructions under that
+HANGMAN_Y = 3
+WORD_Y = 12
+INSTRUCTIONS_Y = WORD_Y + 9
+
 
 class HangmanGame(BaseGame):
     """Hangman word game for the terminal."""
@@ -25,10 +36,16 @@ class HangmanGame(BaseGame):
     def __init__(self):
         super().__init__('hangman', min_height=24, min_width=80)
         
-        self.word = random.choice(WORDS).upper()
+        self.word = WORDS[_randrange(len(WORDS))]
         self.guessed_letters: Set[str] = set()
         self.wrong_guesses = 0
         self.max_wrong = 6
+        
+        # Width-dependent layout, rebuilt on resize
+        self._layout_width = -1
+        self._hangman_x = 0
+        self._word_x = 0
+        self._static_lines = []
     
     def _get_input_timeout(self) -> int:
         return 100
@@ -63,8 +80,8 @@ class HangmanGame(BaseGame):
                 self.game_over = True
                 self.won = False
     
-    def _draw_hangman(self, y: int, x: int):
-        """Draw the hangman figure."""
+    def _get_hangman_lines(self):
+        """Get the hangman figure lines for the current stage."""
         stages = [
             ["  +---+", "  |   |", "      |", "      |", "      |", "      |", "========="],
             ["  +---+", "  |   |", "  O   |", "      |", "      |", "      |", "========="],
@@ -76,8 +93,7 @@ class HangmanGame(BaseGame):
         ]
         
         stage = min(self.wrong_guesses, len(stages) - 1)
-        for i, line in enumerate(stages[stage]):
-            self.stdscr.addstr(y + i, x, line)
+        return stages[stage]
     
     def _handle_input(self, key: int) -> bool:
         """Handle input."""
@@ -92,54 +108,66 @@ class HangmanGame(BaseGame):
         # Hangman is turn-based, no continuous updates
         pass
     
+    def _rebuild_layout(self):
+        """Recompute the positions that only depend on the terminal width."""
+        width = self.width
+        self._layout_width = width
+        self._hangman_x = width // 4
+        # Display word is the letters joined by single spaces
+        self._word_x = (width - (2 * len(self.word) - 1)) // 2
+        
+        # Title and instructions never change text
+        static = [
+            (1, "Hangman", curses.A_BOLD),
+            (INSTRUCTIONS_Y, "Type a letter to guess", curses.A_NORMAL),
+            (INSTRUCTIONS_Y + 1, "Q: Quit", curses.A_NORMAL),
+        ]
+        self._static_lines = [(y, (width - len(text)) // 2, text, attr)
+                              for y, text, attr in static]
+    
     def _draw_game(self):
         """Draw the game state."""
-        self.stdscr.clear()
+        if self.width != self._layout_width:
+            self._rebuild_layout()
+        
+        self.stdscr.erase()
         
-        # Title
-        title = "Hangman"
-        title_x = (self.width - len(title)) // 2
-        self.stdscr.addstr(1, title_x, title, curses.A_BOLD)
+        # Each entry is (y, x, text, attr); x of None means centered
+        lines = list(self._static_lines)
         
-        # Draw hangman
-        hangman_x = self.width // 4
-        hangman_y = 3
-        self._draw_hangman(hangman_y, hangman_x)
+        # Hangman figure
+        hangman_x = self._hangman_x
+        hangman_y = HANGMAN_Y
+        for i, line in enumerate(self._get_hangman_lines()):
+            lines.append((hangman_y + i, hangman_x, line, curses.A_NORMAL))
         
         # Word display
-        display_word = self._get_display_word()
-        word_x = (self.width - len(display_word)) // 2
-        word_y = 12
-        self.stdscr.addstr(word_y, word_x, display_word, curses.A_BOLD)
+        word_y = WORD_Y
+        lines.append((word_y, self._word_x, self._get_display_word(), curses.A_BOLD))
         
         # Guessed letters
-        guessed_text = f"Guessed: {', '.join(sorted(self.guessed_letters))}"
         if self.guessed_letters:
-            self.stdscr.addstr(word_y + 2, (self.width - len(guessed_text)) // 2, guessed_text)
+            guessed_text = f"Guessed: {', '.join(sorted(self.guessed_letters))}"
+            lines.append((word_y + 2, None, guessed_text, curses.A_NORMAL))
         
         # Wrong guesses
         wrong_text = f"Wrong guesses: {self.wrong_guesses}/{self.max_wrong}"
-        self.stdscr.addstr(word_y + 4, (self.width - len(wrong_text)) // 2, wrong_text)
+        lines.append((word_y + 4, None, wrong_text, curses.A_NORMAL))
         
         # Score
         if self.won:
-            score_text = f"Score: {self.score}"
-            self.stdscr.addstr(word_y + 6, (self.width - len(score_text)) // 2, score_text, 
-                            curses.A_BOLD)
+            lines.append((word_y + 6, None, f"Score: {self.score}", curses.A_BOLD))
         
         # Info bar
         if self.high_score is not None and self.settings.get('general', 'show_high_scores', True):
-            high_text = f"High Score: {self.high_score}"
-            self.stdscr.addstr(word_y + 7, (self.width - len(high_text)) // 2, high_text)
-        
-        # Instructions
-        inst_y = word_y + 9
-        instructions = [
-            "Type a letter to guess",
-            "Q: Quit"
-        ]
-        for i, inst in enumerate(instructions):
-            self.stdscr.addstr(inst_y + i, (self.width - len(inst)) // 2, inst)
+            lines.append((word_y + 7, None, f"High Score: {self.high_score}", curses.A_NORMAL))
+        
+        width = self.width
+        addnstr = self.stdscr.addnstr
+        for y, x, text, attr in lines:
+            if x is None:
+                x = (width - len(text)) // 2
+            addnstr(y, x, text, width - x, attr)
         
         self.stdscr.refresh()
     
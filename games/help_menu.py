@@ -1,6 +1,7 @@
 """Help and tutorial system."""
 
 import curses
+import sys
 from utils.ui_helpers import center_text, draw_text_box
 
 
@@ -350,24 +351,29 @@ class HelpMenu:
         stdscr.timeout(100)
         
         try:
+            self._draw_menu(stdscr)
             while True:
-                self._draw_menu(stdscr)
                 key = stdscr.getch()
                 
                 if key == ord('q'):
                     break
                 elif key == curses.KEY_UP:
+                    prev_game = self.current_game
                     self.current_game = (self.current_game - 1) % len(self.games)
+                    self._update_selection(stdscr, prev_game)
                 elif key == curses.KEY_DOWN:
+                    prev_game = self.current_game
                     self.current_game = (self.current_game + 1) % len(self.games)
+                    self._update_selection(stdscr, prev_game)
                 elif key == ord('\n') or key == ord('\r'):
                     self._show_help(stdscr, self.games[self.current_game])
+                    self._draw_menu(stdscr)
         finally:
             curses.endwin()
     
     def _draw_menu(self, stdscr):
         """Draw the help menu selection."""
-        stdscr.clear()
+        stdscr.erase()
         height, width = stdscr.getmaxyx()
         
         # Title
@@ -381,14 +387,30 @@ class HelpMenu:
         stdscr.addstr(4, inst_x, instructions)
         
         # Game list
-        start_y = 6
-        for i, game_key in enumerate(self.games):
-            y = start_y + i * 2
-            name = self.game_names[game_key]
-            if i == self.current_game:
-                stdscr.addstr(y, width // 2 - 10, f"> {name} <", curses.A_REVERSE)
-            else:
-                stdscr.addstr(y, width // 2 - 5, name)
+        for i in range(len(self.games)):
+            self._draw_menu_item(stdscr, i, width)
+        
+        stdscr.refresh()
+    
+    def _draw_menu_item(self, stdscr, index: int, width: int):
+        """Draw a single game entry of the help menu."""
+        y = 6 + index * 2
+        name = self.game_names[self.games[index]]
+        if index == self.current_game:
+            stdscr.addstr(y, width // 2 - 10, f"> {name} <", curses.A_REVERSE)
+        else:
+            stdscr.addstr(y, width // 2 - 5, name)
+    
+    def _update_selection(self, stdscr, prev_game: int):
+        """Repaint only the rows whose highlight changed."""
+        if prev_game == self.current_game:
+            return
+        
+        width = stdscr.getmaxyx()[1]
+        for index in (prev_game, self.current_game):
+            stdscr.move(6 + index * 2, 0)
+            stdscr.clrtoeol()
+            self._draw_menu_item(stdscr, index, width)
         
         stdscr.refresh()
     
@@ -405,7 +427,7 @@ class HelpMenu:
         height, width = stdscr.getmaxyx()
         
         while True:
-            stdscr.clear()
+            stdscr.erase()
             stdscr.border(0)
             
             y = 2
@@ -452,7 +474,7 @@ class HelpMenu:
         height, width = stdscr.getmaxyx()
         
         while True:
-            stdscr.clear()
+            stdscr.erase()
             stdscr.border(0)
             
             y = 2
@@ -482,3 +504,15 @@ class HelpMenu:
             if key == ord('q'):
                 break
 
+
+def _intern_help_strings():
+    """Intern the help text so repeated labels share a single object."""
+    for entry in HelpMenu.GAME_HELP.values():
+        entry['title'] = sys.intern(entry['title'])
+        entry['description'] = sys.intern(entry['description'])
+        entry['controls'] = [(sys.intern(key), sys.intern(desc))
+                             for key, desc in entry['controls']]
+        entry['tips'] = [sys.intern(tip) for tip in entry['tips']]
+
+
+_intern_help_strings()
@@ -3,6 +3,7 @@
 import curses
 from typing import Optional
 from utils.save_manager import SaveManager
+from utils.terminal import buffer_stdout
 from utils.ui_helpers import center_text
 
 
@@ -23,77 +24,123 @@ class LoadMenu:
         'wordle': 'Wordle'
     }
     
+    INSTRUCTIONS = (
+        "↑↓: Select slot",
+        "← →: Change game",
+        "Enter: Load save",
+        "D: Delete save",
+        "Q: Cancel",
+    )
+    
     def __init__(self):
         self.save_manager = SaveManager()
         self.current_game = 0
         self.current_slot = 0
         self.games_with_saves = []
+        # Per-game save lists, so redraws don't re-read every slot file
+        self._save_list_cache = {}
+        # Set whenever the screen needs repainting
+        self._dirty = True
+        # Instruction lines as (y, x, text), rebuilt when the size changes
+        self._instruction_size = None
+        self._instruction_lines = ()
         self._refresh_saves()
     
     def _refresh_saves(self):
         """Refresh list of games with saves."""
+        self._save_list_cache.clear()
         all_saves = self.save_manager.get_all_saves()
         self.games_with_saves = list(all_saves.keys())
         if not self.games_with_saves:
             self.games_with_saves = list(self.GAME_NAMES.keys())  # Show all games
     
+    def _get_save_list(self, game_name: str) -> list:
+        """Get the save list for a game, reading slot files only once."""
+        saves = self._save_list_cache.get(game_name)
+        if saves is None:
+            saves = self.save_manager.get_save_list(game_name)
+            self._save_list_cache[game_name] = saves
+        return saves
+    
     def run(self) -> Optional[tuple]:
         """Run the load menu.
         
         Returns:
             Tuple of (game_name, slot) if a save was selected, None otherwise
         """
-        stdscr = curses.initscr()
-        curses.curs_set(0)
-        curses.noecho()
-        curses.cbreak()
-        stdscr.keypad(True)
-        stdscr.timeout(100)
-        
-        try:
-            while True:
-                self._draw(stdscr)
-                key = stdscr.getch()
-                
-                if key == ord('q') or key == 27:  # Q or ESC
-                    return None
-                elif key == curses.KEY_UP:
-                    if self.current_slot > 0:
-                        self.current_slot -= 1
-                    elif self.current_game > 0:
-                        self.current_game -= 1
-                        self.current_slot = 4
-                elif key == curses.KEY_DOWN:
-                    if self.current_slot < 4:
-                        self.current_slot += 1
-                    elif self.current_game < len(self.games_with_saves) - 1:
-                        self.current_game += 1
-                        self.current_slot = 0
-                elif key == curses.KEY_LEFT:
-                    if self.current_game > 0:
-                        self.current_game -= 1
-                        self.current_slot = 0
-                elif key == curses.KEY_RIGHT:
-                    if self.current_game < len(self.games_with_saves) - 1:
-                        self.current_game += 1
-                        self.current_slot = 0
-                elif key == ord('\n') or key == ord('\r'):  # Enter
-                    game_name = self.games_with_saves[self.current_game]
-                    slot = self.current_slot + 1
-                    if self.save_manager.has_save(game_name, slot):
-                        return (game_name, slot)
-                elif key == ord('d'):  # Delete save
-                    game_name = self.games_with_saves[self.current_game]
-                    slot = self.current_slot + 1
-                    if self.save_manager.has_save(game_name, slot):
-                        self.save_manager.delete_save(game_name, slot)
-                        self._refresh_saves()
-        finally:
-            curses.endwin()
+        with buffer_stdout():
+            stdscr = curses.initscr()
+            curses.curs_set(0)
+            curses.noecho()
+            curses.cbreak()
+            stdscr.keypad(True)
+            stdscr.timeout(-1)  # Block until a key arrives
+            
+            try:
+                while True:
+                    if self._dirty:
+                        self._draw(stdscr)
+                        self._dirty = False
+                    
+                    key = stdscr.getch()
+                    selection = (self.current_game, self.current_slot)
+                    
+                    if key == ord('q') or key == 27:  # Q or ESC
+                        return None
+                    elif key == curses.KEY_UP:
+                        if self.current_slot > 0:
+                            self.current_slot -= 1
+                        elif self.current_game > 0:
+                            self.current_game -= 1
+                            self.current_slot = 4
+                    elif key == curses.KEY_DOWN:
+                        if self.current_slot < 4:
+                            self.current_slot += 1
+                        elif self.current_game < len(self.games_with_saves) - 1:
+                            self.current_game += 1
+                            self.current_slot = 0
+                    elif key == curses.KEY_LEFT:
+                        if self.current_game > 0:
+                            self.current_game -= 1
+                            self.current_slot = 0
+                    elif key == curses.KEY_RIGHT:
+                        if self.current_game < len(self.games_with_saves) - 1:
+                            self.current_game += 1
+                            self.current_slot = 0
+                    elif key == ord('\n') or key == ord('\r'):  # Enter
+                        game_name = self.games_with_saves[self.current_game]
+                        slot = self.current_slot + 1
+                        if self.save_manager.has_save(game_name, slot):
+                            return (game_name, slot)
+                    elif key == ord('d'):  # Delete save
+                        game_name = self.games_with_saves[self.current_game]
+                        slot = self.current_slot + 1
+                        if self.save_manager.has_save(game_name, slot):
+                            self.save_manager.delete_save(game_name, slot)
+                            self._refresh_saves()
+                            self._dirty = True
+                    elif key == curses.KEY_RESIZE:
+                        self._dirty = True
+                    
+                    if (self.current_game, self.current_slot) != selection:
+                        self._dirty = True
+            finally:
+                curses.endwin()
+    
+    def _get_instruction_lines(self, height: int, width: int) -> tuple:
+        """Get the positioned instruction lines for this terminal size."""
+        if self._instruction_size != (height, width):
+            y = height - 6
+            self._instruction_lines = tuple(
+                (y + i, center_text(inst, width), inst)
+                for i, inst in enumerate(self.INSTRUCTIONS)
+            )
+            self._instruction_size = (height, width)
+        return self._instruction_lines
     
     def _draw(self, stdscr):
         """Draw the load menu."""
-        stdscr.clear()
+        stdscr.erase()  # No forced full repaint; curses diffs the screen
         height, width = stdscr.getmaxyx()
         
         # Title
@@ -106,7 +153,8 @@ class LoadMenu:
             stdscr.addstr(height // 2, center_text(msg, width), msg)
             inst = "Q: Back"
             stdscr.addstr(height - 2, center_text(inst, width), inst)
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             return
         
         # Current game
@@ -117,7 +165,7 @@ class LoadMenu:
         stdscr.addstr(3, center_text(game_title, width), game_title)
         
         # Save slots
-        saves = self.save_manager.get_save_list(game_name)
+        saves = self._get_save_list(game_name)
         y = 6
         
         stdscr.addstr(y, 5, "Save Slots:", curses.A_BOLD)
@@ -145,16 +193,9 @@ class LoadMenu:
             y += 1
         
         # Instructions
-        y = height - 6
-        instructions = [
-            "↑↓: Select slot",
-            "← →: Change game",
-            "Enter: Load save",
-            "D: Delete save",
-            "Q: Cancel"
-        ]
-        for i, inst in enumerate(instructions):
-            stdscr.addstr(y + i, center_text(inst, width), inst, curses.A_DIM)
+        for y, x, inst in self._get_instruction_lines(height, width):
+            stdscr.addstr(y, x, inst, curses.A_DIM)
         
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
 
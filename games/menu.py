@@ -1,32 +1,33 @@
 """Main menu for selecting games."""
 
 import curses
+import importlib
 from typing import List, Callable
-from games.snake import SnakeGame
-from games.tetris import TetrisGame
-from games.pacman import PacManGame
-from games.pong import PongGame
-from games.game2048 import Game2048
-from games.minesweeper import MinesweeperGame
-from games.space_invaders import SpaceInvadersGame
-from games.breakout import BreakoutGame
-from games.hangman import HangmanGame
-from games.tictactoe import TicTacToeGame
-from games.wordle import WordleGame
-from games.frogger import FroggerGame
-from games.sudoku import SudokuGame
-from games.connect_four import ConnectFourGame
-from games.battleship import BattleshipGame
-from games.conway import ConwayGame
-from games.asteroids import Asteroids
-from games.centipede import CentipedeGame
-from games.missile_command import MissileCommandGame
-from games.settings_menu import SettingsMenu
-from games.help_menu import HelpMenu
-from games.statistics_menu import StatisticsMenu
-from games.achievements_menu import AchievementsMenu
-from games.load_menu import LoadMenu
-from games.challenges_menu import ChallengesMenu
+from utils.terminal import buffer_stdout
+
+
+# Game name -> (module, class), imported only when a save is loaded
+GAME_MODULES = {
+    'snake': ('games.snake', 'SnakeGame'),
+    'tetris': ('games.tetris', 'TetrisGame'),
+    'pacman': ('games.pacman', 'PacManGame'),
+    'pong': ('games.pong', 'PongGame'),
+    '2048': ('games.game2048', 'Game2048'),
+    'minesweeper': ('games.minesweeper', 'MinesweeperGame'),
+    'space_invaders': ('games.space_invaders', 'SpaceInvadersGame'),
+    'breakout': ('games.breakout', 'BreakoutGame'),
+    'hangman': ('games.hangman', 'HangmanGame'),
+    'tictactoe': ('games.tictactoe', 'TicTacToeGame'),
+    'wordle': ('games.wordle', 'WordleGame'),
+    'frogger': ('games.frogger', 'FroggerGame'),
+    'sudoku': ('games.sudoku', 'SudokuGame'),
+    'connect_four': ('games.connect_four', 'ConnectFourGame'),
+    'battleship': ('games.battleship', 'BattleshipGame'),
+    'conway': ('games.conway', 'ConwayGame'),
+    'asteroids': ('games.asteroids', 'Asteroids'),
+    'centipede': ('games.centipede', 'CentipedeGame'),
+    'missile_command': ('games.missile_command', 'MissileCommandGame'),
+}
 
 
 class GameMenu:
@@ -65,200 +66,224 @@ class GameMenu:
     
     def _run_snake(self):
         """Run the Snake game."""
+        from games.snake import SnakeGame
         game = SnakeGame()
         game.run()
     
     def _run_tetris(self):
         """Run the Tetris game."""
+        from games.tetris import TetrisGame
         game = TetrisGame()
         game.run()
     
     def _run_pacman(self):
         """Run the Pac-Man game."""
+        from games.pacman import PacManGame
         game = PacManGame()
         game.run()
     
     def _run_pong(self):
         """Run the Pong game."""
+        from games.pong import PongGame
         game = PongGame()
         game.run()
     
     def _run_2048(self):
         """Run the 2048 game."""
+        from games.game2048 import Game2048
         game = Game2048()
         game.run()
     
     def _run_minesweeper(self):
         """Run the Minesweeper game."""
+        from games.minesweeper import MinesweeperGame
         game = MinesweeperGame()
         game.run()
     
     def _run_space_invaders(self):
         """Run the Space Invaders game."""
+        from games.space_invaders import SpaceInvadersGame
         game = SpaceInvadersGame()
         game.run()
     
     def _run_breakout(self):
         """Run the Breakout game."""
+        from games.breakout import BreakoutGame
         game = BreakoutGame()
         game.run()
     
     def _run_hangman(self):
         """Run the Hangman game."""
+        from games.hangman import HangmanGame
         game = HangmanGame()
         game.run()
     
     def _run_tictactoe(self):
         """Run the Tic-Tac-Toe game."""
+        from games.tictactoe import TicTacToeGame
         game = TicTacToeGame()
         game.run()
     
     def _run_wordle(self):
         """Run the Wordle game."""
+        from games.wordle import WordleGame
         game = WordleGame()
         game.run()
     
     def _run_frogger(self):
         """Run the Frogger game."""
+        from games.frogger import FroggerGame
         game = FroggerGame()
         game.run()
     
     def _run_sudoku(self):
         """Run the Sudoku game."""
+        from games.sudoku import SudokuGame
         game = SudokuGame()
         game.run()
     
     def _run_connect_four(self):
         """Run the Connect Four game."""
+        from games.connect_four import ConnectFourGame
         game = ConnectFourGame()
         game.run()
     
     def _run_battleship(self):
         """Run the Battleship game."""
+        from games.battleship import BattleshipGame
         game = BattleshipGame()
         game.run()
     
     def _run_conway(self):
         """Run the Conway's Game of Life."""
+        from games.conway import ConwayGame
         game = ConwayGame()
         game.run()
     
     def _run_asteroids(self):
         """Run the Asteroids game."""
+        from games.asteroids import Asteroids
         game = Asteroids()
         game.run()
     
     def _run_centipede(self):
         """Run the Centipede game."""
+        from games.centipede import CentipedeGame
         game = CentipedeGame()
         game.run()
     
     def _run_missile_command(self):
         """Run the Missile Command game."""
+        from games.missile_command import MissileCommandGame
         game = MissileCommandGame()
         game.run()
     
     def _run_load_game(self):
         """Run the load game menu."""
+        from games.load_menu import LoadMenu
         load_menu = LoadMenu()
         result = load_menu.run()
         
         if result:
             game_name, slot = result
             # Load and run the game
-            game_classes = {
-                'snake': SnakeGame,
-                'tetris': TetrisGame,
-                'pacman': PacManGame,
-                'pong': PongGame,
-                '2048': Game2048,
-                'minesweeper': MinesweeperGame,
-                'space_invaders': SpaceInvadersGame,
-                'breakout': BreakoutGame,
-                'hangman': HangmanGame,
-                'tictactoe': TicTacToeGame,
-                'wordle': WordleGame,
-                'frogger': FroggerGame,
-                'sudoku': SudokuGame,
-                'connect_four': ConnectFourGame,
-                'battleship': BattleshipGame,
-                'conway': ConwayGame,
-                'asteroids': Asteroids,
-                'centipede': CentipedeGame,
-                'missile_command': MissileCommandGame,
-            }
-            
-            game_class = game_classes.get(game_name)
+            game_class = self._get_game_class(game_name)
             if game_class:
                 game = game_class()
                 if game._load_game(slot):
                     game.run()
     
+    @staticmethod
+    def _get_game_class(game_name: str):
+        """Import and return the game class for a save's game name.
+        
+        Args:
+            game_name: Game name as stored in the save file
+            
+        Returns:
+            Game class, or None if the game is unknown
+        """
+        entry = GAME_MODULES.get(game_name)
+        if entry is None:
+            return None
+        module_name, class_name = entry
+        return getattr(importlib.import_module(module_name), class_name)
+    
     def _run_settings(self):
         """Run the Settings menu."""
+        from games.settings_menu import SettingsMenu
         settings = SettingsMenu()
         settings.run()
     
     def _run_statistics(self):
         """Run the Statistics menu."""
+        from games.statistics_menu import StatisticsMenu
         stats = StatisticsMenu()
         stats.run()
     
     def _run_challenges(self):
         """Run the Daily Challenges menu."""
+        from games.challenges_menu import ChallengesMenu
         challenges_menu = ChallengesMenu()
         challenges_menu.run()
     
     def _run_achievements(self):
         """Run the Achievements menu."""
+        from games.achievements_menu import AchievementsMenu
         achievements_menu = AchievementsMenu()
         achievements_menu.run()
     
     def _run_help(self):
         """Run the Help menu."""
+        from games.help_menu import HelpMenu
         help_menu = HelpMenu()
         help_menu.run()
     
     def run(self):
         """Display and handle the game menu."""
-        stdscr = curses.initscr()
-        curses.curs_set(0)  # Hide cursor
-        curses.noecho()  # Don't echo keys
-        curses.cbreak()  # React to keys immediately
-        stdscr.keypad(True)  # Enable special keys
-        stdscr.timeout(100)  # Non-blocking input
-        
-        try:
-            while True:
-                self._draw_menu(stdscr)
-                key = stdscr.getch()
-                
-                if key == curses.KEY_UP:
-                    self.current_selection = (self.current_selection - 1) % len(self.games)
-                elif key == curses.KEY_DOWN:
-                    self.current_selection = (self.current_selection + 1) % len(self.games)
-                elif key == ord('\n') or key == ord('\r'):  # Enter key
-                    name, game_func = self.games[self.current_selection]
-                    if game_func is None:  # Exit
+        with buffer_stdout():
+            stdscr = curses.initscr()
+            curses.curs_set(0)  # Hide cursor
+            curses.noecho()  # Don't echo keys
+            curses.cbreak()  # React to keys immediately
+            stdscr.keypad(True)  # Enable special keys
+            stdscr.timeout(-1)  # Block until a key arrives
+            
+            try:
+                while True:
+                    self._draw_menu(stdscr)
+                    key = stdscr.getch()
+                    
+                    if key == curses.KEY_UP:
+                        self.current_selection = (self.current_selection - 1) % len(self.games)
+                    elif key == curses.KEY_DOWN:
+                        self.current_selection = (self.current_selection + 1) % len(self.games)
+                    elif key == ord('\n') or key == ord('\r'):  # Enter key
+                        name, game_func = self.games[self.current_selection]
+                        if game_func is None:  # Exit
+                            break
+                        # Restore terminal before running game
+                        curses.endwin()
+                        game_func()
+                        # Reinitialize after game
+                        stdscr = curses.initscr()
+                        curses.curs_set(0)
+                        curses.noecho()
+                        curses.cbreak()
+                        stdscr.keypad(True)
+                        stdscr.timeout(-1)
+                    elif key == ord('q'):
                         break
-                    # Restore terminal before running game
-                    curses.endwin()
-                    game_func()
-                    # Reinitialize after game
-                    stdscr = curses.initscr()
-                    curses.curs_set(0)
-                    curses.noecho()
-                    curses.cbreak()
-                    stdscr.keypad(True)
-                    stdscr.timeout(100)
-                elif key == ord('q'):
-                    break
-        finally:
-            curses.endwin()
+            finally:
+                curses.endwin()
     
     def _draw_menu(self, stdscr):
-        """Draw the menu on the screen."""
-        stdscr.clear()
+        """Draw the menu on the screen.
+        
+        Uses erase() rather than clear() so curses only sends the cells
+        that differ from what is already on screen.
+        """
+        stdscr.erase()
         height, width = stdscr.getmaxyx()
         
         # Title
@@ -280,5 +305,6 @@ class GameMenu:
             else:
                 stdscr.addstr(y, width // 2 - 5, name)
         
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
 
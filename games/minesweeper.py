@@ -3,126 +3,178 @@
 import curses
 import random
 import time
+from collections import deque
 from typing import List, Tuple, Dict, Any
 from utils.base_game import BaseGame
 from utils.ui_helpers import draw_game_over_screen
 
 
+# Grid value marking a mine (bytearray cells are unsigned)
+MINE = 9
+
+# Draw codes beyond the grid values: hidden and flagged cells
+HIDDEN = 10
+FLAG = 11
+
+# Glyph per draw code: 0-8 adjacent counts, MINE, HIDDEN, FLAG
+_CELL_GLYPHS = (' ', '1', '2', '3', '4', '5', '6', '7', '8', '*', '#', 'F')
+
+# (dy, dx) offsets of the eight neighbouring cells
+_NEIGHBORS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
 class MinesweeperGame(BaseGame):
     """Minesweeper game for the terminal."""
     
+    TITLE = "Minesweeper"
+    
+    INSTRUCTIONS = (
+        "Arrow Keys: Move cursor",
+        "Space/Enter: Reveal",
+        "F: Toggle flag",
+        "Q: Quit",
+    )
+    
     def __init__(self):
         super().__init__('minesweeper', min_height=24, min_width=80)
         
-        self.width = 16
-        self.height = 12
+        # Board size in cells (self.width/height hold the terminal size)
+        self.board_width = 16
+        self.board_height = 12
         self.mine_count = 20
         
-        # Grid: -1 = mine, 0-8 = adjacent mine count
-        self.grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
-        # Revealed: True = revealed, False = hidden
-        self.revealed = [[False for _ in range(self.width)] for _ in range(self.height)]
-        # Flagged: True = flagged
-        self.flagged = [[False for _ in range(self.width)] for _ in range(self.height)]
+        # Flat row-major buffers, indexed y * width + x
+        # Grid: MINE = mine, 0-8 = adjacent mine count
+        self.grid = bytearray(self.board_width * self.board_height)
+        # Revealed: 1 = revealed, 0 = hidden
+        self.revealed = bytearray(self.board_width * self.board_height)
+        # Flagged: 1 = flagged
+        self.flagged = bytearray(self.board_width * self.board_height)
         
         self.first_click = True
         self.cells_revealed = 0
         self.start_time = None
         
         # Cursor position
-        self.cursor_x = self.width // 2
-        self.cursor_y = self.height // 2
+        self.cursor_x = self.board_width // 2
+        self.cursor_y = self.board_height // 2
+        
+        # Previous frame's (char, attr) per cell; None forces a full redraw
+        self._prev_cells = None
+        self._prev_flags = None
+        self._last_drawn_second = None
+        # Set by input; without it only the timer can need repainting
+        self._board_dirty = True
+        
+        # Screen offsets, recomputed when the terminal width changes
+        self._layout_width = -1
+        self._board_x = 0
+        self._title_x = 0
     
     def _get_input_timeout(self) -> int:
-        return 100
+        # Block until a key arrives; once the timer runs, wake once per
+        # second so the displayed time keeps ticking
+        if self.start_time is not None and not self.game_over:
+            return 1000
+        return -1
     
     def _init_game(self):
         """Initialize game state."""
-        pass  # Mines placed on first click
+        # Mines are placed on the first reveal. Input blocks until then and
+        # the loop draws after each key, so show the board before the first
+        self._draw_game()
     
     def _place_mines(self, exclude_y: int, exclude_x: int):
         """Place mines randomly, excluding the first clicked cell."""
-        mines_placed = 0
-        while mines_placed < self.mine_count:
-            y = random.randint(0, self.height - 1)
-            x = random.randint(0, self.width - 1)
-            if (y == exclude_y and x == exclude_x) or self.grid[y][x] == -1:
-                continue
-            self.grid[y][x] = -1
-            mines_placed += 1
-        
-        # Calculate adjacent mine counts
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.grid[y][x] != -1:
-                    count = 0
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dy == 0 and dx == 0:
-                                continue
-                            ny, nx = y + dy, x + dx
-                            if 0 <= ny < self.height and 0 <= nx < self.width:
-                                if self.grid[ny][nx] == -1:
-                                    count += 1
-                    self.grid[y][x] = count
-    
-    def _reveal_cell(self, y: int, x: int):
-        """Reveal a cell and recursively reveal adjacent cells if zero."""
-        if not (0 <= y < self.height and 0 <= x < self.width):
-            return
-        if self.revealed[y][x] or self.flagged[y][x]:
-            return
+        grid = self.grid
+        width = self.board_width
+        height = self.board_height
         
-        self.revealed[y][x] = True
-        self.cells_revealed += 1
+        # Sample distinct cells directly instead of retrying on collisions
+        candidates = list(range(width * height))
+        candidates.remove(exclude_y * width + exclude_x)
+        mines = random.sample(candidates, self.mine_count)
+        for mine in mines:
+            grid[mine] = MINE
         
-        # If mine, game over
-        if self.grid[y][x] == -1:
-            self.game_over = True
-            self.won = False
-            return
+        # Calculate adjacent mine counts in one pass over the mines
+        for mine in mines:
+            y, x = divmod(mine, width)
+            for dy, dx in _NEIGHBORS:
+                ny, nx = y + dy, x + dx
+                if 0 <= ny < height and 0 <= nx < width:
+                    neighbor = ny * width + nx
+                    if grid[neighbor] != MINE:
+                        grid[neighbor] += 1
+    
+    def _reveal_cell(self, y: int, x: int):
+        """Reveal a cell and flood-fill adjacent cells if zero."""
+        grid = self.grid
+        revealed = self.revealed
+        flagged = self.flagged
+        width = self.board_width
+        height = self.board_height
         
-        # If zero, reveal adjacent cells
-        if self.grid[y][x] == 0:
-            for dy in [-1, 0, 1]:
-                for dx in [-1, 0, 1]:
-                    if dy == 0 and dx == 0:
-                        continue
-                    self._reveal_cell(y + dy, x + dx)
+        pending = deque([(y, x)])
+        while pending:
+            y, x = pending.popleft()
+            if not (0 <= y < height and 0 <= x < width):
+                continue
+            i = y * width + x
+            if revealed[i] or flagged[i]:
+                continue
+            
+            revealed[i] = 1
+            self.cells_revealed += 1
+            
+            # If mine, game over
+            if grid[i] == MINE:
+                self.game_over = True
+                self.won = False
+                return
+            
+            # If zero, reveal adjacent cells
+            if grid[i] == 0:
+                for dy, dx in _NEIGHBORS:
+                    pending.append((y + dy, x + dx))
     
     def _check_win(self):
         """Check if all non-mine cells are revealed."""
-        total_cells = self.width * self.height
+        total_cells = self.board_width * self.board_height
         if self.cells_revealed == total_cells - self.mine_count:
             self.won = True
             self.game_over = True
     
     def _handle_input(self, key: int) -> bool:
         """Handle input."""
+        if key != -1:
+            self._board_dirty = True
+        
         if key == ord('q'):
             return False
         elif key == curses.KEY_UP:
             self.cursor_y = max(0, self.cursor_y - 1)
         elif key == curses.KEY_DOWN:
-            self.cursor_y = min(self.height - 1, self.cursor_y + 1)
+            self.cursor_y = min(self.board_height - 1, self.cursor_y + 1)
         elif key == curses.KEY_LEFT:
             self.cursor_x = max(0, self.cursor_x - 1)
         elif key == curses.KEY_RIGHT:
-            self.cursor_x = min(self.width - 1, self.cursor_x + 1)
+            self.cursor_x = min(self.board_width - 1, self.cursor_x + 1)
         elif key == ord(' ') or key == ord('\n'):
             # Reveal cell
-            if not self.flagged[self.cursor_y][self.cursor_x]:
+            if not self.flagged[self.cursor_y * self.board_width + self.cursor_x]:
                 if self.first_click:
                     self._place_mines(self.cursor_y, self.cursor_x)
                     self.first_click = False
                     self.start_time = time.time()
+                    self.stdscr.timeout(self._get_input_timeout())
                 self._reveal_cell(self.cursor_y, self.cursor_x)
                 self._check_win()
         elif key == ord('f'):
             # Toggle flag
-            if not self.revealed[self.cursor_y][self.cursor_x]:
-                self.flagged[self.cursor_y][self.cursor_x] = \
-                    not self.flagged[self.cursor_y][self.cursor_x]
+            i = self.cursor_y * self.board_width + self.cursor_x
+            if not self.revealed[i]:
+                self.flagged[i] ^= 1
         return True
     
     def _update_game(self, delta_time: float):
@@ -130,63 +182,122 @@ class MinesweeperGame(BaseGame):
         # Minesweeper is turn-based, no continuous updates
         pass
     
-    def _draw_game(self):
-        """Draw the game state."""
-        self.stdscr.clear()
+    def _draw_header(self, flags_used: int):
+        """Draw the title and flag counter row."""
+        self.stdscr.move(0, 0)
+        self.stdscr.clrtoeol()
         
         # Title
-        title = "Minesweeper"
-        title_x = (self.width - len(title)) // 2
-        self.stdscr.addstr(0, title_x, title, curses.A_BOLD)
+        self.stdscr.addstr(0, self._title_x, self.TITLE, curses.A_BOLD)
         
         # Info
-        flags_used = sum(sum(row) for row in self.flagged)
         info_text = f"Flags: {flags_used}/{self.mine_count}"
         self.stdscr.addstr(0, 2, info_text)
+    
+    def _update_timer(self) -> bool:
+        """Draw the elapsed time if the displayed second changed.
         
-        if self.start_time:
-            elapsed = int(time.time() - self.start_time)
-            time_text = f"Time: {elapsed}s"
-            self.stdscr.addstr(0, self.width - len(time_text) - 2, time_text)
+        Returns:
+            True if the timer was redrawn
+        """
+        if not self.start_time:
+            return False
+        
+        elapsed = int(time.time() - self.start_time)
+        if elapsed == self._last_drawn_second:
+            return False
+        
+        self._last_drawn_second = elapsed
+        time_text = f"Time: {elapsed}s"
+        self.stdscr.addstr(0, self.width - len(time_text) - 2, time_text)
+        return True
+    
+    def _draw_instructions(self, board_start_y: int):
+        """Draw the static instruction lines below the board."""
+        inst_y = board_start_y + self.board_height + 1
+        for i, inst in enumerate(self.INSTRUCTIONS):
+            self.stdscr.addstr(inst_y + i, 2, inst)
+    
+    def _update_layout(self):
+        """Recompute board and title offsets for the terminal width."""
+        self._layout_width = self.width
+        # Each cell takes two columns (glyph plus spacing)
+        self._board_x = (self.width - self.board_width * 2) // 2
+        self._title_x = (self.width - len(self.TITLE)) // 2
+        # Everything moved, so the next frame must repaint from scratch
+        self._prev_cells = None
+    
+    def _draw_game(self):
+        """Draw the game state.
+        
+        Only cells whose character or attribute changed since the last
+        frame are written. Between key presses only the timer is updated.
+        """
+        if not self._board_dirty:
+            if self._update_timer():
+                self.stdscr.noutrefresh()
+                curses.doupdate()
+            return
+        self._board_dirty = False
+        
+        if self.width != self._layout_width:
+            self._update_layout()
         
-        # Draw grid
         board_start_y = 2
-        board_start_x = (self.width - self.width * 2) // 2
+        board_start_x = self._board_x
         
-        for y in range(self.height):
-            for x in range(self.width):
-                cell_y = board_start_y + y
-                cell_x = board_start_x + x * 2
+        if self._prev_cells is None:
+            self.stdscr.erase()
+            self._prev_cells = [[None] * self.board_width for _ in range(self.board_height)]
+            self._prev_flags = None
+            self._draw_instructions(board_start_y)
+        
+        # Header
+        flags_used = self.flagged.count(1)
+        if flags_used != self._prev_flags:
+            self._prev_flags = flags_used
+            self._draw_header(flags_used)
+            # Clearing the header row also wiped the timer
+            self._last_drawn_second = None
+        self._update_timer()
+        
+        # Draw grid (hot loop: bind attributes to locals)
+        addstr = self.stdscr.addstr
+        grid = self.grid
+        revealed = self.revealed
+        flagged = self.flagged
+        prev_cells = self._prev_cells
+        width = self.board_width
+        cursor_y = self.cursor_y
+        cursor_x = self.cursor_x
+        a_reverse = curses.A_REVERSE
+        a_normal = curses.A_NORMAL
+        a_bold = curses.A_BOLD
+        glyphs = _CELL_GLYPHS
+        
+        for y in range(self.board_height):
+            prev_row = prev_cells[y]
+            cell_y = board_start_y + y
+            for x in range(width):
+                i = y * width + x
                 
                 # Cursor highlight
-                is_cursor = (y == self.cursor_y and x == self.cursor_x)
-                attr = curses.A_REVERSE if is_cursor else curses.A_NORMAL
+                is_cursor = (y == cursor_y and x == cursor_x)
+                attr = a_reverse if is_cursor else a_normal
                 
-                if self.revealed[y][x]:
-                    if self.grid[y][x] == -1:
-                        self.stdscr.addstr(cell_y, cell_x, "*", curses.A_BOLD)
-                    elif self.grid[y][x] == 0:
-                        self.stdscr.addstr(cell_y, cell_x, " ", attr)
-                    else:
-                        num_str = str(self.grid[y][x])
-                        self.stdscr.addstr(cell_y, cell_x, num_str, attr)
-                elif self.flagged[y][x]:
-                    self.stdscr.addstr(cell_y, cell_x, "F", curses.A_BOLD, attr)
-                else:
-                    self.stdscr.addstr(cell_y, cell_x, "#", attr)
-        
-        # Instructions
-        inst_y = board_start_y + self.height + 1
-        instructions = [
-            "Arrow Keys: Move cursor",
-            "Space/Enter: Reveal",
-            "F: Toggle flag",
-            "Q: Quit"
-        ]
-        for i, inst in enumerate(instructions):
-            self.stdscr.addstr(inst_y + i, 2, inst)
+                code = grid[i] if revealed[i] else (FLAG if flagged[i] else HIDDEN)
+                if code == MINE:
+                    attr = a_bold
+                elif code == FLAG:
+                    attr |= a_bold
+                cell = (glyphs[code], attr)
+                
+                if prev_row[x] != cell:
+                    prev_row[x] = cell
+                    addstr(cell_y, board_start_x + x * 2, cell[0], cell[1])
         
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+        curses.doupdate()
     
     def _get_game_state(self) -> Dict[str, Any]:
         """Get game state for achievements."""
@@ -8,9 +8,110 @@ from utils.base_game import BaseGame
 from utils.ui_helpers import draw_game_over_screen
 
 
+def _build_disk_runs(max_radius: int) -> Tuple[Tuple[Tuple[int, int, int], ...], ...]:
+    """Precompute filled-disk rows for each integer radius.
+
+    Each row is a ``(dy, dx_start, length)`` horizontal run covering the
+    cells with ``dx*dx + dy*dy <= r*r``, so a disk draws as one string per row.
+    """
+    disks = []
+    for r in range(max_radius + 1):
+        runs = []
+        for dy in range(-r, r + 1):
+            half = math.isqrt(r * r - dy * dy)
+            runs.append((dy, -half, 2 * half + 1))
+        disks.append(tuple(runs))
+    return tuple(disks)
+
+
+DISK_RUNS = _build_disk_runs(6)
+
+# Uniform [0, 1) values drawn per refill of the spawn RNG batch
+RNG_BATCH = 64
+
+
+def _remove_indices(columns, indices):
+    """Remove the entries at the given indices from every column, in place.
+
+    Marks removed entries in a bytearray (which also ignores duplicates),
+    then refills each column from the surviving indices in one pass instead
+    of popping (and shifting) once per removed entry.
+    """
+    if not indices:
+        return
+    drop = bytearray(len(columns[0]))
+    for i in indices:
+        drop[i] = 1
+    keep = [i for i, dropped in enumerate(drop) if not dropped]
+    for column in columns:
+        column[:] = [column[i] for i in keep]
+
+
+class MissileColumns:
+    """Missiles stored as parallel per-field lists (struct of arrays)."""
+    
+    def __init__(self):
+        self.x: List[float] = []
+        self.y: List[float] = []
+        self.dx: List[float] = []
+        self.dy: List[float] = []
+        self.target_x: List[float] = []
+        self.target_y: List[float] = []
+    
+    def __len__(self) -> int:
+        return len(self.x)
+    
+    def _columns(self):
+        return (self.x, self.y, self.dx, self.dy, self.target_x, self.target_y)
+    
+    def append(self, x, y, target_x, target_y, dx, dy):
+        """Add a missile travelling from (x, y) towards the target."""
+        self.x.append(x)
+        self.y.append(y)
+        self.dx.append(dx)
+        self.dy.append(dy)
+        self.target_x.append(target_x)
+        self.target_y.append(target_y)
+    
+    def remove(self, indices: List[int]):
+        """Remove missiles at the given indices."""
+        _remove_indices(self._columns(), indices)
+
+
+class ExplosionColumns:
+    """Explosions stored as parallel per-field lists (struct of arrays)."""
+    
+    def __init__(self):
+        self.x: List[float] = []
+        self.y: List[float] = []
+        self.radius: List[float] = []
+        self.max_radius: List[float] = []
+        self.expanding: List[bool] = []
+    
+    def __len__(self) -> int:
+        return len(self.x)
+    
+    def append(self, x, y, max_radius=5.0):
+        """Add a new explosion that starts expanding from radius 0."""
+        self.add(x, y, 0.0, max_radius, True)
+    
+    def add(self, x, y, radius, max_radius, expanding):
+        """Add an explosion with the given state."""
+        self.x.append(x)
+        self.y.append(y)
+        self.radius.append(radius)
+        self.max_radius.append(max_radius)
+        self.expanding.append(expanding)
+
+
 class MissileCommandGame(BaseGame):
     """Missile Command defense game for the terminal."""
     
+    INSTRUCTIONS = (
+        "Arrow Keys: Move crosshair | 1/2/3: Select base | Space: Fire",
+        "P: Pause | Q: Quit",
+    )
+    
     def __init__(self):
         super().__init__('missile_command', min_height=24, min_width=80)
         
@@ -18,6 +119,12 @@ class MissileCommandGame(BaseGame):
         self.GAME_WIDTH = 76
         self.GAME_HEIGHT = 20
         
+        # Screen offset of the play field and its exclusive draw bounds
+        self.OFFSET_X = 2
+        self.OFFSET_Y = 2
+        self._y_hi = self.OFFSET_Y + self.GAME_HEIGHT
+        self._x_hi = self.OFFSET_X + self.GAME_WIDTH
+        
         # Base positions (3 missile bases)
         self.bases = [
             {'x': 10, 'ammo': 10, 'alive': True},
@@ -36,6 +143,12 @@ class MissileCommandGame(BaseGame):
             {'x': city_spacing * 7, 'alive': True},
         ]
         
+        # Survivor counts and enemy targets, kept in step with the 'alive' flags
+        self.cities_alive_count = 0
+        self.bases_alive_count = 0
+        self._alive_targets: List[Tuple[str, int]] = []
+        self._recount_alive()
+        
         # Crosshair
         self.crosshair_x = self.GAME_WIDTH // 2
         self.crosshair_y = self.GAME_HEIGHT // 2
@@ -44,9 +157,9 @@ class MissileCommandGame(BaseGame):
         self.active_base = 1  # Middle base
         
         # Missiles and explosions
-        self.enemy_missiles: List[Dict] = []
-        self.player_missiles: List[Dict] = []
-        self.explosions: List[Dict] = []
+        self.enemy_missiles = MissileColumns()
+        self.player_missiles = MissileColumns()
+        self.explosions = ExplosionColumns()
         
         # Game state
         self.wave = 1
@@ -55,12 +168,24 @@ class MissileCommandGame(BaseGame):
         self.missiles_in_wave = 0
         self.missiles_spawned = 0
         
+        # Pause between waves, counted down in _update_game
+        self._pending_wave = False
+        self._wave_cooldown_left = 0.0
+        
         # Timing
         self.spawn_timer = 0
         self.spawn_interval = 1.0
+        self.enemy_speed = 0.5 + (self.wave * 0.05)
+        
+        # Pre-drawn random values for spawning, consumed from the end
+        self._rolls: List[float] = []
         
         # Score
         self.cities_saved = 0
+        
+        # Pre-drawn static chrome (border, instructions), built on first draw
+        self._background = None
+        self._background_size = (0, 0)
     
     def _get_input_timeout(self) -> int:
         return 50
@@ -75,21 +200,33 @@ class MissileCommandGame(BaseGame):
         # Reset cities
         for city in self.cities:
             city['alive'] = True
+        self._recount_alive()
         
         self.wave = 1
         self.wave_active = False
-        self.enemy_missiles = []
-        self.player_missiles = []
-        self.explosions = []
+        self.enemy_missiles = MissileColumns()
+        self.player_missiles = MissileColumns()
+        self.explosions = ExplosionColumns()
         self._start_wave()
     
+    def _recount_alive(self):
+        """Recompute surviving counts and enemy targets from the alive flags."""
+        self.cities_alive_count = sum(1 for city in self.cities if city['alive'])
+        self.bases_alive_count = sum(1 for base in self.bases if base['alive'])
+        self._alive_targets = (
+            [('city', city['x']) for city in self.cities if city['alive']] +
+            [('base', base['x']) for base in self.bases if base['alive']]
+        )
+    
     def _start_wave(self):
         """Start a new wave."""
+        self._pending_wave = False
         self.wave_active = True
         self.missiles_in_wave = 5 + (self.wave * 2)
         self.missiles_spawned = 0
         self.spawn_timer = 0
         self.spawn_interval = max(0.3, 1.0 - (self.wave * 0.05))
+        self.enemy_speed = 0.5 + (self.wave * 0.05)
     
     def _handle_input(self, key: int) -> bool:
         """Handle player input."""
@@ -138,48 +275,47 @@ class MissileCommandGame(BaseGame):
             start_x = base['x']
             start_y = self.GAME_HEIGHT - 1
             
-            self.player_missiles.append({
-                'x': start_x,
-                'y': start_y,
-                'target_x': self.crosshair_x,
-                'target_y': self.crosshair_y,
-                'dx': (self.crosshair_x - start_x) / 30.0,
-                'dy': (self.crosshair_y - start_y) / 30.0,
-            })
+            self.player_missiles.append(
+                start_x, start_y,
+                self.crosshair_x, self.crosshair_y,
+                (self.crosshair_x - start_x) / 30.0,
+                (self.crosshair_y - start_y) / 30.0,
+            )
+    
+    def _next_roll(self) -> float:
+        """Return the next pre-drawn uniform [0, 1) value, refilling in batches."""
+        if not self._rolls:
+            rand = random.random
+            self._rolls = [rand() for _ in range(RNG_BATCH)]
+        return self._rolls.pop()
     
     def _spawn_enemy_missile(self):
         """Spawn an enemy missile."""
         # Random spawn at top
-        start_x = random.randint(0, self.GAME_WIDTH - 1)
+        start_x = int(self._next_roll() * self.GAME_WIDTH)
         
         # Random target (city or base)
-        targets = []
-        for city in self.cities:
-            if city['alive']:
-                targets.append(('city', city['x']))
-        for base in self.bases:
-            if base['alive']:
-                targets.append(('base', base['x']))
-        
+        targets = self._alive_targets
         if targets:
-            target_type, target_x = random.choice(targets)
+            target_type, target_x = targets[int(self._next_roll() * len(targets))]
             target_y = self.GAME_HEIGHT - 1
             
-            # Calculate velocity
-            distance = math.sqrt((target_x - start_x)**2 + (target_y - 0)**2)
-            speed = 0.5 + (self.wave * 0.05)
+            # Velocity: one hypot and one divide give the per-unit scale
+            scale = self.enemy_speed / math.hypot(target_x - start_x, target_y)
             
-            self.enemy_missiles.append({
-                'x': start_x,
-                'y': 0,
-                'target_x': target_x,
-                'target_y': target_y,
-                'dx': (target_x - start_x) / distance * speed,
-                'dy': target_y / distance * speed,
-            })
+            self.enemy_missiles.append(
+                start_x, 0, target_x, target_y,
+                (target_x - start_x) * scale, target_y * scale,
+            )
     
     def _update_game(self, delta_time: float):
         """Update game state."""
+        # Count down the pause before the next wave
+        if self._pending_wave:
+            self._wave_cooldown_left -= delta_time
+            if self._wave_cooldown_left <= 0:
+                self._start_wave()
+        
         # Spawn enemy missiles
         if self.wave_active and self.missiles_spawned < self.missiles_in_wave:
             self.spawn_timer += delta_time
@@ -188,74 +324,76 @@ class MissileCommandGame(BaseGame):
                 self._spawn_enemy_missile()
                 self.missiles_spawned += 1
         
-        # Update enemy missiles
-        missiles_to_remove = []
-        for i, missile in enumerate(self.enemy_missiles):
-            missile['x'] += missile['dx']
-            missile['y'] += missile['dy']
+        # Update enemy missiles, keeping survivors in a single pass
+        survivors = MissileColumns()
+        enemy = self.enemy_missiles
+        for x, y, dx, dy, tx, ty in zip(enemy.x, enemy.y, enemy.dx, enemy.dy,
+                                        enemy.target_x, enemy.target_y):
+            x += dx
+            y += dy
             
-            # Check if reached target
-            dist = math.sqrt((missile['x'] - missile['target_x'])**2 + 
-                           (missile['y'] - missile['target_y'])**2)
-            if dist < 1.0:
+            # Check if reached target (squared distance, no sqrt needed)
+            ox = x - tx
+            oy = y - ty
+            if ox * ox + oy * oy < 1.0:
                 # Impact!
-                self._enemy_impact(missile['target_x'], missile['target_y'])
-                missiles_to_remove.append(i)
-        
-        for i in reversed(missiles_to_remove):
-            self.enemy_missiles.pop(i)
+                self._enemy_impact(tx, ty)
+            else:
+                survivors.append(x, y, tx, ty, dx, dy)
+        enemy = self.enemy_missiles = survivors
         
         # Update player missiles
-        missiles_to_remove = []
-        for i, missile in enumerate(self.player_missiles):
-            missile['x'] += missile['dx']
-            missile['y'] += missile['dy']
+        survivors = MissileColumns()
+        player = self.player_missiles
+        for x, y, dx, dy, tx, ty in zip(player.x, player.y, player.dx, player.dy,
+                                        player.target_x, player.target_y):
+            x += dx
+            y += dy
             
             # Check if reached target
-            dist = math.sqrt((missile['x'] - missile['target_x'])**2 + 
-                           (missile['y'] - missile['target_y'])**2)
-            if dist < 1.0:
+            ox = x - tx
+            oy = y - ty
+            if ox * ox + oy * oy < 1.0:
                 # Create explosion
-                self.explosions.append({
-                    'x': missile['target_x'],
-                    'y': missile['target_y'],
-                    'radius': 0.0,
-                    'max_radius': 5.0,
-                    'expanding': True,
-                })
-                missiles_to_remove.append(i)
-        
-        for i in reversed(missiles_to_remove):
-            self.player_missiles.pop(i)
+                self.explosions.append(tx, ty)
+            else:
+                survivors.append(x, y, tx, ty, dx, dy)
+        self.player_missiles = survivors
         
         # Update explosions
-        explosions_to_remove = []
-        for i, explosion in enumerate(self.explosions):
-            if explosion['expanding']:
-                explosion['radius'] += 0.3
-                if explosion['radius'] >= explosion['max_radius']:
-                    explosion['expanding'] = False
+        survivors = ExplosionColumns()
+        explosions = self.explosions
+        for ex, ey, radius, max_radius, expanding in zip(
+                explosions.x, explosions.y, explosions.radius,
+                explosions.max_radius, explosions.expanding):
+            if expanding:
+                radius += 0.3
+                if radius >= max_radius:
+                    expanding = False
             else:
-                explosion['radius'] -= 0.2
-                if explosion['radius'] <= 0:
-                    explosions_to_remove.append(i)
+                radius -= 0.2
+                if radius <= 0:
+                    continue  # Burnt out
+            survivors.add(ex, ey, radius, max_radius, expanding)
+        self.explosions = survivors
+        
+        # Check collisions: each enemy missile against every live blast
+        blasts = [(ex, ey, radius * radius)
+                  for ex, ey, radius in zip(survivors.x, survivors.y, survivors.radius)
+                  if radius > 0]
+        if blasts:
+            destroyed = []
+            for j, (mx, my) in enumerate(zip(enemy.x, enemy.y)):
+                for ex, ey, radius_sq in blasts:
+                    dx = mx - ex
+                    dy = my - ey
+                    if dx * dx + dy * dy < radius_sq:
+                        destroyed.append(j)
+                        break
+            self.score += 25 * len(destroyed)
             
-            # Check collisions with enemy missiles
-            for j, missile in enumerate(self.enemy_missiles):
-                dist = math.sqrt((missile['x'] - explosion['x'])**2 + 
-                               (missile['y'] - explosion['y'])**2)
-                if dist < explosion['radius']:
-                    if j not in missiles_to_remove:
-                        self.score += 25
-                        missiles_to_remove.append(j)
-        
-        for i in reversed(explosions_to_remove):
-            self.explosions.pop(i)
-        
-        # Remove destroyed enemy missiles
-        for i in reversed(sorted(set(missiles_to_remove))):
-            if i < len(self.enemy_missiles):
-                self.enemy_missiles.pop(i)
+            # Remove destroyed enemy missiles
+            enemy.remove(destroyed)
         
         # Check wave completion
         if (self.wave_active and self.missiles_spawned >= self.missiles_in_wave and 
@@ -268,12 +406,16 @@ class MissileCommandGame(BaseGame):
         for city in self.cities:
             if city['alive'] and abs(city['x'] - x) < 3:
                 city['alive'] = False
+                self.cities_alive_count -= 1
+                self._alive_targets.remove(('city', city['x']))
                 return
         
         # Check bases
         for base in self.bases:
             if base['alive'] and abs(base['x'] - x) < 3:
                 base['alive'] = False
+                self.bases_alive_count -= 1
+                self._alive_targets.remove(('base', base['x']))
                 return
     
     def _end_wave(self):
@@ -281,10 +423,8 @@ class MissileCommandGame(BaseGame):
         self.wave_active = False
         
         # Bonus for surviving cities
-        for city in self.cities:
-            if city['alive']:
-                self.score += 100
-                self.cities_saved += 1
+        self.score += 100 * self.cities_alive_count
+        self.cities_saved += self.cities_alive_count
         
         # Bonus for remaining ammo
         for base in self.bases:
@@ -292,10 +432,7 @@ class MissileCommandGame(BaseGame):
                 self.score += base['ammo'] * 5
         
         # Check game over conditions
-        cities_alive = sum(1 for city in self.cities if city['alive'])
-        bases_alive = sum(1 for base in self.bases if base['alive'])
-        
-        if cities_alive == 0 or bases_alive == 0:
+        if self.cities_alive_count == 0 or self.bases_alive_count == 0:
             self.game_over = True
             self.won = False
         else:
@@ -307,14 +444,31 @@ class MissileCommandGame(BaseGame):
                 if base['alive']:
                     base['ammo'] = 10
             
-            import time
-            time.sleep(1.0)
-            self._start_wave()
+            # Start the next wave after a short pause without blocking the loop
+            self._pending_wave = True
+            self._wave_cooldown_left = 1.0
+    
+    def _get_background(self):
+        """Return a pad holding the border and instructions.
+
+        The pad is drawn once per terminal size; each frame copies it over
+        the screen in place of clearing and repainting the static chrome.
+        """
+        size = (self.height, self.width)
+        if self._background is None or self._background_size != size:
+            background = curses.newpad(self.height, self.width)
+            background.border(0)
+            inst_y = self.OFFSET_Y + self.GAME_HEIGHT + 1
+            for i, inst in enumerate(self.INSTRUCTIONS):
+                inst_x = (self.width - len(inst)) // 2
+                background.addstr(inst_y + i, inst_x, inst)
+            self._background = background
+            self._background_size = size
+        return self._background
     
     def _draw_game(self):
         """Draw the game."""
-        self.stdscr.clear()
-        self.stdscr.border(0)
+        self._get_background().overwrite(self.stdscr)
         
         # Title and stats
         title = f"Missile Command - Wave {self.wave}"
@@ -325,9 +479,11 @@ class MissileCommandGame(BaseGame):
         score_str = f"Score: {self.score}"
         self.stdscr.addstr(0, self.width - len(score_str) - 2, score_str)
         
-        # Offset for game area
-        offset_x = 2
-        offset_y = 2
+        # Offset and bounds for game area
+        offset_x = self.OFFSET_X
+        offset_y = self.OFFSET_Y
+        y_hi = self._y_hi
+        x_hi = self._x_hi
         
         # Draw cities
         for city in self.cities:
@@ -353,49 +509,37 @@ class MissileCommandGame(BaseGame):
                 self.stdscr.addstr(by, bx, 'X', curses.A_DIM)
         
         # Draw enemy missiles
-        for missile in self.enemy_missiles:
-            mx = offset_x + int(missile['x'])
-            my = offset_y + int(missile['y'])
-            if 0 <= my < offset_y + self.GAME_HEIGHT and 0 <= mx < offset_x + self.GAME_WIDTH:
+        for x, y in zip(self.enemy_missiles.x, self.enemy_missiles.y):
+            mx = offset_x + int(x)
+            my = offset_y + int(y)
+            if 0 <= my < y_hi and 0 <= mx < x_hi:
                 self.stdscr.addstr(my, mx, '↓', curses.A_BOLD)
         
         # Draw player missiles
-        for missile in self.player_missiles:
-            mx = offset_x + int(missile['x'])
-            my = offset_y + int(missile['y'])
-            if 0 <= my < offset_y + self.GAME_HEIGHT and 0 <= mx < offset_x + self.GAME_WIDTH:
+        for x, y in zip(self.player_missiles.x, self.player_missiles.y):
+            mx = offset_x + int(x)
+            my = offset_y + int(y)
+            if 0 <= my < y_hi and 0 <= mx < x_hi:
                 self.stdscr.addstr(my, mx, '↑', curses.A_BOLD)
         
         # Draw explosions
-        for explosion in self.explosions:
-            ex = int(explosion['x'])
-            ey = int(explosion['y'])
-            radius = int(explosion['radius'])
-            
-            for dy in range(-radius, radius + 1):
-                for dx in range(-radius, radius + 1):
-                    if dx*dx + dy*dy <= radius*radius:
-                        draw_x = offset_x + ex + dx
-                        draw_y = offset_y + ey + dy
-                        if (0 <= draw_y < offset_y + self.GAME_HEIGHT and 
-                            0 <= draw_x < offset_x + self.GAME_WIDTH):
-                            self.stdscr.addstr(draw_y, draw_x, '*', curses.A_BOLD)
-        
-        # Draw crosshair
+        explosions = self.explosions
+        for ex, ey, radius in zip(explosions.x, explosions.y, explosions.radius):
+            cx = offset_x + int(ex)
+            cy = offset_y + int(ey)
+            for dy, dx, length in DISK_RUNS[int(radius)]:
+                draw_y = cy + dy
+                if not 0 <= draw_y < y_hi:
+                    continue
+                start = max(cx + dx, 0)
+                end = min(cx + dx + length, x_hi)
+                if start < end:
+                    self.stdscr.addstr(draw_y, start, '*' * (end - start), curses.A_BOLD)
+        
+        # Draw crosshair (input keeps it inside the play field)
         cx = offset_x + self.crosshair_x
         cy = offset_y + self.crosshair_y
-        if 0 <= cy < offset_y + self.GAME_HEIGHT and 0 <= cx < offset_x + self.GAME_WIDTH:
-            self.stdscr.addstr(cy, cx, '+', curses.A_REVERSE | curses.A_BOLD)
-        
-        # Instructions
-        inst_y = offset_y + self.GAME_HEIGHT + 1
-        instructions = [
-            "Arrow Keys: Move crosshair | 1/2/3: Select base | Space: Fire",
-            "P: Pause | Q: Quit"
-        ]
-        for i, inst in enumerate(instructions):
-            inst_x = (self.width - len(inst)) // 2
-            self.stdscr.addstr(inst_y + i, inst_x, inst)
+        self.stdscr.addstr(cy, cx, '+', curses.A_REVERSE | curses.A_BOLD)
         
         # Pause message
         self._draw_pause_message()
@@ -405,10 +549,9 @@ class MissileCommandGame(BaseGame):
     def _get_game_state(self) -> Dict[str, Any]:
         """Get game state for achievements."""
         state = super()._get_game_state()
-        cities_alive = sum(1 for city in self.cities if city['alive'])
         state.update({
             'wave': self.wave,
-            'cities_alive': cities_alive,
+            'cities_alive': self.cities_alive_count,
             'cities_saved': self.cities_saved,
         })
         return state
@@ -429,13 +572,14 @@ class MissileCommandGame(BaseGame):
         super()._deserialize_state(state)
         self.bases = state.get('bases', self.bases)
         self.cities = state.get('cities', self.cities)
+        self._recount_alive()
         self.wave = state.get('wave', 1)
         self.cities_saved = state.get('cities_saved', 0)
         self._start_wave()
     
     def _draw_game_over(self, is_new_high: bool = False):
         """Draw game over screen."""
-        cities_alive = sum(1 for city in self.cities if city['alive'])
+        cities_alive = self.cities_alive_count
         if cities_alive > 0:
             title = "CITIES SAVED!"
             self.won = True
@@ -35,6 +35,113 @@ MAZE_LAYOUT = [
     "####################",
 ]
 
+MAZE_HEIGHT = len(MAZE_LAYOUT)
+MAZE_WIDTH = max(len(row) for row in MAZE_LAYOUT)
+
+# Screen character for each maze cell value, and which of them draw bold
+MAZE_CHARS = ' #.O'
+BOLD_CHARS = '#O'
+
+
+def row_segments(row: str) -> Tuple[Tuple[int, str, int], ...]:
+    """Split a rendered maze row into (x, text, attr) runs of equal attribute."""
+    segments = []
+    start = 0
+    bold = row[0] in BOLD_CHARS
+    for x in range(1, len(row)):
+        cell_bold = row[x] in BOLD_CHARS
+        if cell_bold != bold:
+            segments.append((start, row[start:x], curses.A_BOLD if bold else curses.A_NORMAL))
+            start = x
+            bold = cell_bold
+    segments.append((start, row[start:], curses.A_BOLD if bold else curses.A_NORMAL))
+    return tuple(segments)
+
+
+# Directions are ints in hot paths; index into DIR_VECS for the (dy, dx) step
+DIR_LIST = list(Direction)
+DIR_VECS = tuple(direction.value for direction in DIR_LIST)
+DIR_INDEX = {direction: i for i, direction in enumerate(DIR_LIST)}
+UP, DOWN, LEFT, RIGHT = (DIR_INDEX[d] for d in
+                         (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT))
+
+
+
+def _build_open_masks() -> bytearray:
+    """Precompute, per maze cell, a bitmask of directions leading off-wall.
+
+    Bit ``d`` is set when the neighbour in direction ``d`` is inside the maze
+    and not a wall. Walls never change during play, so the table is built
+    once from MAZE_LAYOUT (cells past a short row's end count as walls).
+    """
+    def is_open(y, x):
+        return (0 <= y < MAZE_HEIGHT and 0 <= x < len(MAZE_LAYOUT[y]) and
+                MAZE_LAYOUT[y][x] not in '# ')
+    
+    masks = bytearray(MAZE_WIDTH * MAZE_HEIGHT)
+    for y in range(MAZE_HEIGHT):
+        for x in range(MAZE_WIDTH):
+            mask = 0
+            for d, (dy, dx) in enumerate(DIR_VECS):
+                if is_open(y + dy, x + dx):
+                    mask |= 1 << d
+            masks[y * MAZE_WIDTH + x] = mask
+    return masks
+
+
+OPEN_MASKS = _build_open_masks()
+
+# Per cell, the (direction, row, column) steps allowed by OPEN_MASKS
+OPEN_MOVES = tuple(
+    tuple((d, y + DIR_VECS[d][0], x + DIR_VECS[d][1])
+          for d in range(4) if OPEN_MASKS[y * MAZE_WIDTH + x] >> d & 1)
+    for y in range(MAZE_HEIGHT) for x in range(MAZE_WIDTH)
+)
+
+KEY_DIRECTIONS = {
+    curses.KEY_UP: UP,
+    curses.KEY_DOWN: DOWN,
+    curses.KEY_LEFT: LEFT,
+    curses.KEY_RIGHT: RIGHT,
+}
+
+
+# Uniform [0, 1) values drawn per refill of the ghost RNG batch
+RNG_BATCH = 64
+
+
+def move_ghosts(gy, gx, gdir, frightened, py, px, rolls):
+    """Advance every ghost one step through the maze.
+
+    Ghost state is passed as parallel lists (row, column, int direction,
+    frightened flag) and updated in place. Each ghost's open neighbours come
+    from the OPEN_MOVES table and are used both to choose and to take the
+    step: frightened ghosts pick one at random, the others the one closest
+    to Pac-Man by Manhattan distance. Random picks pop from ``rolls``, a list
+    of pre-drawn uniform values that is refilled in batches when empty.
+    """
+    width = MAZE_WIDTH
+    for g in range(len(gy)):
+        moves = OPEN_MOVES[gy[g] * width + gx[g]]
+        if not moves:
+            continue
+        
+        if frightened[g]:
+            if not rolls:
+                rand = random.random
+                rolls.extend([rand() for _ in range(RNG_BATCH)])
+            best = moves[int(rolls.pop() * len(moves))]
+        else:
+            best = moves[0]
+            min_dist = abs(best[1] - py) + abs(best[2] - px)
+            for move in moves[1:]:
+                dist = abs(move[1] - py) + abs(move[2] - px)
+                if dist < min_dist:
+                    min_dist = dist
+                    best = move
+        
+        gdir[g], gy[g], gx[g] = best
+
 
 class PacManGame(BaseGame):
     """Classic Pac-Man game for the terminal."""
@@ -42,19 +149,27 @@ class PacManGame(BaseGame):
     def __init__(self):
         super().__init__('pacman', min_height=24, min_width=80)
         
-        self.maze = []
+        # Flat row-major maze, indexed y * MAZE_WIDTH + x
+        self.maze = bytearray()
+        # Rendered maze rows and their attribute runs, updated as dots are eaten
+        self.maze_row_strs: List[str] = []
+        self._maze_row_segments: List[Tuple[Tuple[int, str, int], ...]] = []
         self.pacman_pos = (1, 1)
-        self.pacman_dir = Direction.RIGHT
-        self.next_dir = Direction.RIGHT
-        self.ghosts = [
-            {'pos': (6, 9), 'dir': Direction.LEFT, 'frightened': False},
-            {'pos': (6, 10), 'dir': Direction.RIGHT, 'frightened': False},
-            {'pos': (8, 9), 'dir': Direction.UP, 'frightened': False},
-            {'pos': (8, 10), 'dir': Direction.DOWN, 'frightened': False},
-        ]
+        self.pacman_dir = RIGHT
+        self.next_dir = RIGHT
+        # Ghost state as parallel lists: row, column, direction index, frightened
+        self.ghost_y = [6, 6, 8, 8]
+        self.ghost_x = [9, 10, 9, 10]
+        self.ghost_dir = [LEFT, RIGHT, UP, DOWN]
+        self.ghost_frightened = [False, False, False, False]
+        self._ghost_rolls: List[float] = []
         self.dots_remaining = 0
         self.power_pellet_time = 0
         self.ghost_move_counter = 0
+        
+        # Cells covered by sprites last frame; None forces a full redraw
+        self._sprite_cells = None
+        self._overlay_drawn = False
     
     def _get_input_timeout(self) -> int:
         base_timeout = 150
@@ -64,36 +179,41 @@ class PacManGame(BaseGame):
     def _init_game(self):
         """Initialize maze."""
         self._init_maze()
+        self._sprite_cells = None
     
     def _init_maze(self):
         """Initialize the maze from layout."""
-        self.maze = []
+        # Start all walls so short layout rows are padded out to MAZE_WIDTH
+        self.maze = bytearray([1]) * (MAZE_WIDTH * MAZE_HEIGHT)
         self.dots_remaining = 0
-        for row in MAZE_LAYOUT:
-            maze_row = []
-            for char in row:
-                if char == '#':
-                    maze_row.append(1)  # Wall
-                elif char == ' ':
-                    maze_row.append(1)  # Wall (spaces are walls)
+        for y, row in enumerate(MAZE_LAYOUT):
+            base = y * MAZE_WIDTH
+            for x, char in enumerate(row):
+                if char == '#' or char == ' ':
+                    continue  # Wall (spaces are walls)
+                if random.random() < 0.15:  # 15% chance for power pellet
+                    self.maze[base + x] = 3  # Power pellet
                 else:
-                    if random.random() < 0.15:  # 15% chance for power pellet
-                        maze_row.append(3)  # Power pellet
-                        self.dots_remaining += 1
-                    else:
-                        maze_row.append(2)  # Dot
-                        self.dots_remaining += 1
-            self.maze.append(maze_row)
+                    self.maze[base + x] = 2  # Dot
+                self.dots_remaining += 1
+        
+        self.maze_row_strs = [
+            ''.join(MAZE_CHARS[cell] for cell in self.maze[y * MAZE_WIDTH:(y + 1) * MAZE_WIDTH])
+            for y in range(MAZE_HEIGHT)
+        ]
+        self._maze_row_segments = [row_segments(row) for row in self.maze_row_strs]
     
-    def _can_move(self, pos, direction):
+    def _clear_cell(self, y: int, x: int):
+        """Empty a maze cell and re-render its row."""
+        self.maze[y * MAZE_WIDTH + x] = 0
+        row = self.maze_row_strs[y]
+        row = row[:x] + ' ' + row[x + 1:]
+        self.maze_row_strs[y] = row
+        self._maze_row_segments[y] = row_segments(row)
+    
+    def _can_move(self, pos, direction: int):
         """Check if a position is valid for movement."""
-        dy, dx = direction.value
-        new_y, new_x = pos[0] + dy, pos[1] + dx
-        
-        if new_y < 0 or new_y >= len(self.maze) or new_x < 0 or new_x >= len(self.maze[0]):
-            return False
-        
-        return self.maze[new_y][new_x] != 1  # Not a wall
+        return bool(OPEN_MASKS[pos[0] * MAZE_WIDTH + pos[1]] >> direction & 1)
     
     def _move_pacman(self):
         """Move Pac-Man."""
@@ -102,60 +222,39 @@ class PacManGame(BaseGame):
                 self.pacman_dir = self.next_dir
         
         if self._can_move(self.pacman_pos, self.pacman_dir):
-            dy, dx = self.pacman_dir.value
+            dy, dx = DIR_VECS[self.pacman_dir]
             self.pacman_pos = (self.pacman_pos[0] + dy, self.pacman_pos[1] + dx)
             
             # Collect dot or power pellet
             y, x = self.pacman_pos
-            if self.maze[y][x] == 2:  # Dot
-                self.maze[y][x] = 0
+            cell = self.maze[y * MAZE_WIDTH + x]
+            if cell == 2:  # Dot
+                self._clear_cell(y, x)
                 self.score += 10
                 self.dots_remaining -= 1
-            elif self.maze[y][x] == 3:  # Power pellet
-                self.maze[y][x] = 0
+            elif cell == 3:  # Power pellet
+                self._clear_cell(y, x)
                 self.score += 50
                 self.dots_remaining -= 1
                 self.power_pellet_time = 10.0
-                for ghost in self.ghosts:
-                    ghost['frightened'] = True
+                self.ghost_frightened = [True] * len(self.ghost_y)
     
     def _move_ghosts(self):
         """Move all ghosts with simple AI."""
-        for ghost in self.ghosts:
-            if ghost['frightened']:
-                possible_dirs = [d for d in Direction if self._can_move(ghost['pos'], d)]
-                if possible_dirs:
-                    ghost['dir'] = random.choice(possible_dirs)
-            else:
-                py, px = self.pacman_pos
-                gy, gx = ghost['pos']
-                
-                best_dir = ghost['dir']
-                min_dist = float('inf')
-                
-                for direction in Direction:
-                    if self._can_move(ghost['pos'], direction):
-                        dy, dx = direction.value
-                        new_pos = (gy + dy, gx + dx)
-                        dist = abs(new_pos[0] - py) + abs(new_pos[1] - px)
-                        if dist < min_dist:
-                            min_dist = dist
-                            best_dir = direction
-                
-                ghost['dir'] = best_dir
-            
-            if self._can_move(ghost['pos'], ghost['dir']):
-                dy, dx = ghost['dir'].value
-                ghost['pos'] = (ghost['pos'][0] + dy, ghost['pos'][1] + dx)
+        py, px = self.pacman_pos
+        move_ghosts(self.ghost_y, self.ghost_x, self.ghost_dir,
+                    self.ghost_frightened, py, px, self._ghost_rolls)
     
     def _check_collisions(self):
         """Check for collisions between Pac-Man and ghosts."""
-        for ghost in self.ghosts:
-            if ghost['pos'] == self.pacman_pos:
-                if ghost['frightened']:
+        py, px = self.pacman_pos
+        for g in range(len(self.ghost_y)):
+            if self.ghost_y[g] == py and self.ghost_x[g] == px:
+                if self.ghost_frightened[g]:
                     self.score += 200
-                    ghost['pos'] = (6, 9)
-                    ghost['frightened'] = False
+                    self.ghost_y[g] = 6
+                    self.ghost_x[g] = 9
+                    self.ghost_frightened[g] = False
                 else:
                     self.game_over = True
     
@@ -165,15 +264,8 @@ class PacManGame(BaseGame):
             return False
         elif key == ord('p'):
             self.paused = not self.paused
-        elif not self.paused:
-            if key == curses.KEY_UP:
-                self.next_dir = Direction.UP
-            elif key == curses.KEY_DOWN:
-                self.next_dir = Direction.DOWN
-            elif key == curses.KEY_LEFT:
-                self.next_dir = Direction.LEFT
-            elif key == curses.KEY_RIGHT:
-                self.next_dir = Direction.RIGHT
+        elif not self.paused and key in KEY_DIRECTIONS:
+            self.next_dir = KEY_DIRECTIONS[key]
         return True
     
     def _update_game(self, delta_time: float):
@@ -185,8 +277,7 @@ class PacManGame(BaseGame):
         if self.power_pellet_time > 0:
             self.power_pellet_time -= delta_time
             if self.power_pellet_time <= 0:
-                for ghost in self.ghosts:
-                    ghost['frightened'] = False
+                self.ghost_frightened = [False] * len(self.ghost_y)
         
         # Move Pac-Man
         self._move_pacman()
@@ -205,22 +296,49 @@ class PacManGame(BaseGame):
             self.won = True
             self.game_over = True
     
+    def _draw_full(self, maze_start_y: int, maze_start_x: int):
+        """Erase the screen and draw the maze and controls."""
+        self.stdscr.erase()
+        
+        # Draw maze, one addstr per run of equally styled cells
+        addstr = self.stdscr.addstr
+        for y, segments in enumerate(self._maze_row_segments):
+            draw_y = maze_start_y + y
+            for x, text, attr in segments:
+                addstr(draw_y, maze_start_x + x, text, attr)
+        
+        # Controls
+        info_x = maze_start_x + MAZE_WIDTH + 3
+        controls = [
+            "Arrow Keys: Move",
+            "P: Pause",
+            "Q: Quit"
+        ]
+        for i, control in enumerate(controls):
+            self.stdscr.addstr(10 + i, info_x, control)
+    
     def _draw_game(self):
-        """Draw the game state."""
-        self.stdscr.clear()
+        """Draw the game state.
         
+        After a full draw, only the cells Pac-Man and the ghosts covered last
+        frame are restored from the maze before the sprites are drawn again.
+        Overlays (pause, achievements) force a full redraw while shown and on
+        the frame after they go away.
+        """
         maze_start_y = 2
         maze_start_x = 2
         
-        # Draw maze
-        for y, row in enumerate(self.maze):
-            for x, cell in enumerate(row):
-                if cell == 1:  # Wall
-                    self.stdscr.addch(maze_start_y + y, maze_start_x + x, '#', curses.A_BOLD)
-                elif cell == 2:  # Dot
-                    self.stdscr.addch(maze_start_y + y, maze_start_x + x, '.')
-                elif cell == 3:  # Power pellet
-                    self.stdscr.addch(maze_start_y + y, maze_start_x + x, 'O', curses.A_BOLD)
+        overlay = self.paused or bool(self.pending_achievements)
+        if self._sprite_cells is None or overlay or self._overlay_drawn:
+            self._draw_full(maze_start_y, maze_start_x)
+        else:
+            # Restore the background under last frame's sprites
+            maze = self.maze
+            for y, x in self._sprite_cells:
+                char = MAZE_CHARS[maze[y * MAZE_WIDTH + x]]
+                attr = curses.A_BOLD if char in BOLD_CHARS else curses.A_NORMAL
+                self.stdscr.addch(maze_start_y + y, maze_start_x + x, char, attr)
+        self._overlay_drawn = overlay
         
         # Draw Pac-Man
         self.stdscr.addch(maze_start_y + self.pacman_pos[0], maze_start_x + self.pacman_pos[1], 
@@ -228,31 +346,26 @@ class PacManGame(BaseGame):
         
         # Draw ghosts
         ghost_chars = ['G', 'G', 'G', 'G']
-        for i, ghost in enumerate(self.ghosts):
-            attr = curses.A_DIM if ghost['frightened'] else curses.A_BOLD
-            self.stdscr.addch(maze_start_y + ghost['pos'][0], maze_start_x + ghost['pos'][1], 
+        for i in range(len(self.ghost_y)):
+            attr = curses.A_DIM if self.ghost_frightened[i] else curses.A_BOLD
+            self.stdscr.addch(maze_start_y + self.ghost_y[i], maze_start_x + self.ghost_x[i], 
                             ghost_chars[i], attr)
+        self._sprite_cells = [self.pacman_pos] + list(zip(self.ghost_y, self.ghost_x))
         
-        # Info
-        info_x = maze_start_x + len(self.maze[0]) + 3
+        # Info (rows 0-1 only hold the info bar, so clear them first)
+        for row in (0, 1):
+            self.stdscr.move(row, 0)
+            self.stdscr.clrtoeol()
         extra_info = {'Dots': self.dots_remaining}
         if self.power_pellet_time > 0:
             extra_info['Power'] = f"{int(self.power_pellet_time)}s"
         self._draw_info_bar(extra_info)
         
-        # Controls
-        controls = [
-            "Arrow Keys: Move",
-            "P: Pause",
-            "Q: Quit"
-        ]
-        for i, control in enumerate(controls):
-            self.stdscr.addstr(10 + i, info_x, control)
-        
         # Pause message
         self._draw_pause_message()
         
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+        curses.doupdate()
     
     def _draw_game_over(self, is_new_high: bool = False):
         """Draw game over screen."""
@@ -8,6 +8,11 @@ from utils.base_game import BaseGame
 from utils.ui_helpers import draw_game_over_screen
 
 
+def _random_sign() -> int:
+    """Return -1 or 1 with equal probability from a single random bit."""
+    return (random.getrandbits(1) << 1) - 1
+
+
 class PongGame(BaseGame):
     """Classic Pong game for the terminal."""
     
@@ -28,7 +33,7 @@ class PongGame(BaseGame):
         self.ball_x = self.board_width // 2
         self.ball_y = self.board_height // 2
         self.ball_vx = 1
-        self.ball_vy = random.choice([-1, 1])
+        self.ball_vy = _random_sign()
         
         # Scores
         self.score1 = 0
@@ -39,11 +44,19 @@ class PongGame(BaseGame):
         # AI
         self.ai_mode = True
         self.ai_difficulty = 0.7
+        # Row where the ball will reach the AI paddle; None while it moves away
+        self._ai_target = None
+        self._predict_ai_target()
         
         # Game speed
         self.base_speed = 0.05
         self.game_speed = self.base_speed * self._get_game_speed()
         self.last_move_time = 0
+        
+        # Board frame: fixed border strings and one reusable buffer per row
+        self._h_border = '-' * (self.board_width + 2)
+        self._blank_row = b' ' * self.board_width
+        self._board_rows = [bytearray(self._blank_row) for _ in range(self.board_height)]
     
     def _get_input_timeout(self) -> int:
         return int(self.game_speed * 1000)
@@ -69,7 +82,8 @@ class PongGame(BaseGame):
             hit_pos = (self.ball_y - self.paddle1_y) / self.paddle_height
             self.ball_vy = int((hit_pos - 0.5) * 2)
             if self.ball_vy == 0:
-                self.ball_vy = random.choice([-1, 1])
+                self.ball_vy = _random_sign()
+            self._predict_ai_target()
         
         if (self.ball_x == self.board_width - 1 and
             self.paddle2_y <= self.ball_y < self.paddle2_y + self.paddle_height):
@@ -77,14 +91,35 @@ class PongGame(BaseGame):
             hit_pos = (self.ball_y - self.paddle2_y) / self.paddle_height
             self.ball_vy = int((hit_pos - 0.5) * 2)
             if self.ball_vy == 0:
-                self.ball_vy = random.choice([-1, 1])
+                self.ball_vy = _random_sign()
+            self._ai_target = None
     
-    def _move_ai(self):
-        """Move AI paddle to track the ball."""
-        target_y = self.ball_y - self.paddle_height // 2
+    def _predict_ai_target(self):
+        """Predict the row where the ball reaches the AI paddle column.
+        
+        Wall bounces mirror the ball, so its path folds the straight-line
+        row into [0, board_height - 1] with period 2 * (board_height - 1).
+        Computed once per approach rather than re-aimed every tick.
+        """
+        if self.ball_vx <= 0:
+            self._ai_target = None
+            return
+        
+        steps = (self.board_width - 1 - self.ball_x) // self.ball_vx
+        raw_y = self.ball_y + self.ball_vy * steps
+        period = 2 * (self.board_height - 1)
+        folded = raw_y % period
+        target = folded if folded <= self.board_height - 1 else period - folded
         
         if random.random() > self.ai_difficulty:
-            target_y += random.randint(-2, 2)
+            target += random.randint(-2, 2)
+        self._ai_target = target
+    
+    def _move_ai(self):
+        """Move AI paddle toward the predicted ball row."""
+        if self._ai_target is None:
+            return
+        target_y = self._ai_target - self.paddle_height // 2
         
         if target_y < self.paddle2_y:
             self.paddle2_y = max(0, self.paddle2_y - self.paddle_speed)
@@ -96,8 +131,9 @@ class PongGame(BaseGame):
         """Reset ball to center after scoring."""
         self.ball_x = self.board_width // 2
         self.ball_y = self.board_height // 2
-        self.ball_vx = random.choice([-1, 1])
-        self.ball_vy = random.choice([-1, 1])
+        self.ball_vx = _random_sign()
+        self.ball_vy = _random_sign()
+        self._predict_ai_target()
     
     def _handle_input(self, key: int) -> bool:
         """Handle input."""
@@ -127,12 +163,15 @@ class PongGame(BaseGame):
         if self.paused:
             return
         
-        # Move ball at fixed intervals
+        # Move ball at fixed intervals, keeping the leftover time and
+        # catching up with extra steps after a slow frame
         self.last_move_time += delta_time
-        if self.last_move_time < self.game_speed:
-            return
-        self.last_move_time = 0
-        
+        while self.last_move_time >= self.game_speed and not self.game_over:
+            self.last_move_time -= self.game_speed
+            self._step()
+    
+    def _step(self):
+        """Advance the ball, AI and scoring by one fixed step."""
         self._update_ball()
         
         # AI movement
@@ -158,41 +197,54 @@ class PongGame(BaseGame):
             self.won = False
     
     def _draw_game(self):
-        """Draw the game state."""
-        self.stdscr.clear()
+        """Draw the game state into the frame buffer and flush the changes."""
+        frame = self._begin_frame()
         
         board_start_y = 2
         board_start_x = (self.width - self.board_width) // 2
         
-        # Draw board border
-        for y in range(self.board_height + 2):
-            self.stdscr.addch(board_start_y + y, board_start_x - 1, '|')
-            self.stdscr.addch(board_start_y + y, board_start_x + self.board_width, '|')
-        for x in range(self.board_width + 2):
-            self.stdscr.addch(board_start_y - 1, board_start_x - 1 + x, '-')
-            self.stdscr.addch(board_start_y + self.board_height, board_start_x - 1 + x, '-')
-        
-        # Draw paddles
+        # Compose the board interior: clear each row buffer, then stamp
+        # paddles and ball into it
+        rows = self._board_rows
+        for row in rows:
+            row[:] = self._blank_row
+        paddle2_x = self.board_width - 1
         for i in range(self.paddle_height):
-            self.stdscr.addch(board_start_y + self.paddle1_y + i, board_start_x, '|', curses.A_BOLD)
-            self.stdscr.addch(board_start_y + self.paddle2_y + i, board_start_x + self.board_width - 1, 
-                            '|', curses.A_BOLD)
+            rows[self.paddle1_y + i][0] = ord('|')
+            rows[self.paddle2_y + i][paddle2_x] = ord('|')
+        ball_y = int(self.ball_y)
+        ball_x = int(self.ball_x)
+        ball_visible = 0 <= ball_y < self.board_height and 0 <= ball_x < self.board_width
+        if ball_visible:
+            rows[ball_y][ball_x] = ord('O')
         
-        # Draw ball
-        self.stdscr.addch(board_start_y + int(self.ball_y), board_start_x + int(self.ball_x), 'O', 
-                        curses.A_BOLD)
+        # Emit the board with one addstr per row, borders included
+        addstr = frame.addstr
+        addstr(board_start_y - 1, board_start_x - 1, self._h_border)
+        for y, row in enumerate(rows):
+            addstr(board_start_y + y, board_start_x - 1, '|' + row.decode() + '|')
+        addstr(board_start_y + self.board_height, board_start_x - 1, self._h_border)
+        
+        # Bold the paddle and ball cells in place
+        chgat = frame.chgat
+        bold = curses.A_BOLD
+        for i in range(self.paddle_height):
+            chgat(board_start_y + self.paddle1_y + i, board_start_x, 1, bold)
+            chgat(board_start_y + self.paddle2_y + i, board_start_x + paddle2_x, 1, bold)
+        if ball_visible:
+            chgat(board_start_y + ball_y, board_start_x + ball_x, 1, bold)
         
         # Draw scores
         score1_text = f"P1: {self.score1}"
         score2_text = f"P2: {self.score2}"
-        self.stdscr.addstr(board_start_y - 1, board_start_x + 2, score1_text)
-        self.stdscr.addstr(board_start_y - 1, board_start_x + self.board_width - len(score2_text) - 2, 
-                         score2_text)
+        frame.addstr(board_start_y - 1, board_start_x + 2, score1_text)
+        frame.addstr(board_start_y - 1, board_start_x + self.board_width - len(score2_text) - 2, 
+                     score2_text)
         
         # Info
         info_x = board_start_x + self.board_width + 5
         mode_text = "AI Mode" if self.ai_mode else "2-Player"
-        self._draw_info_bar({'Mode': mode_text, 'First to': self.max_score})
+        self._draw_info_bar({'Mode': mode_text, 'First to': self.max_score}, frame)
         
         # Controls
         controls = [
@@ -203,12 +255,12 @@ class PongGame(BaseGame):
             "Q: Quit"
         ]
         for i, control in enumerate(controls):
-            self.stdscr.addstr(10 + i, info_x, control)
+            frame.addstr(10 + i, info_x, control)
         
         # Pause message
-        self._draw_pause_message()
+        self._draw_pause_message(frame)
         
-        self.stdscr.refresh()
+        self._end_frame()
     
     def _get_game_state(self) -> Dict[str, Any]:
         """Get game state for achievements."""
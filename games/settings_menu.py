@@ -36,6 +36,12 @@ class SettingsMenu:
             'sound_enabled': [True, False],
             'theme': ['classic', 'dark', 'neon', 'retro', 'minimal'],
         }
+        # Setting keys per category and formatted "Name: [VALUE]" labels,
+        # so redraws and key presses do not rebuild them every time
+        self._keys_cache = {cat: tuple(self.settings.get_game_settings(cat).keys())
+                            for cat in self.categories}
+        self._rendered = {}
+        self._dirty = True
     
     def run(self):
         """Display and handle the settings menu."""
@@ -44,12 +50,18 @@ class SettingsMenu:
         curses.noecho()
         curses.cbreak()
         stdscr.keypad(True)
-        stdscr.timeout(100)
+        # Nothing animates here, so block until a key arrives
+        stdscr.timeout(-1)
         
         try:
             while True:
-                self._draw_menu(stdscr)
+                # Only redraw after input; an interrupted getch returns -1
+                if self._dirty:
+                    self._draw_menu(stdscr)
+                    self._dirty = False
                 key = stdscr.getch()
+                if key != -1:
+                    self._dirty = True
                 
                 if key == ord('q'):
                     break
@@ -72,26 +84,25 @@ class SettingsMenu:
                     self._change_setting(1)
                 elif key == ord('r'):
                     self.settings.reset_to_defaults()
+                    self._rendered.clear()
         finally:
             curses.endwin()
     
     def _get_max_setting_index(self) -> int:
         """Get the maximum setting index for current category."""
         category = self.categories[self.current_category]
-        settings = self.settings.get_game_settings(category)
-        return max(0, len(settings) - 1)
+        return max(0, len(self._keys_cache[category]) - 1)
     
     def _change_setting(self, direction: int):
         """Change the current setting value."""
         category = self.categories[self.current_category]
-        settings = self.settings.get_game_settings(category)
-        setting_keys = list(settings.keys())
+        setting_keys = self._keys_cache[category]
         
         if not setting_keys or self.current_setting >= len(setting_keys):
             return
         
         key = setting_keys[self.current_setting]
-        current_value = settings[key]
+        current_value = self.settings.get(category, key)
         
         if key in self.setting_options:
             options = self.setting_options[key]
@@ -100,9 +111,27 @@ class SettingsMenu:
                 new_index = (current_index + direction) % len(options)
                 new_value = options[new_index]
                 self.settings.set(category, key, new_value)
+                self._rendered.pop((category, key), None)
             except (ValueError, IndexError):
                 pass
     
+    def _format_setting(self, category: str, key: str) -> str:
+        """Format a setting as "Name: [VALUE]" for display."""
+        value = self.settings.get(category, key)
+        
+        # Format setting name
+        setting_name = key.replace('_', ' ').title()
+        
+        # Format value
+        if isinstance(value, bool):
+            value_str = "ON" if value else "OFF"
+        elif isinstance(value, int):
+            value_str = str(value)
+        else:
+            value_str = value.upper()
+        
+        return f"{setting_name}: [{value_str}]"
+    
     def _draw_menu(self, stdscr):
         """Draw the settings menu."""
         stdscr.clear()
@@ -122,34 +151,28 @@ class SettingsMenu:
         start_y = 4
         y = start_y
         
+        header_attr = curses.A_BOLD
+        selected_header_attr = curses.A_BOLD | curses.A_REVERSE
         for cat_idx, category in enumerate(self.categories):
             # Category header
             cat_name = self.category_names[category]
-            attr = curses.A_BOLD | curses.A_REVERSE if cat_idx == self.current_category else curses.A_BOLD
+            attr = selected_header_attr if cat_idx == self.current_category else header_attr
             stdscr.addstr(y, 5, f"{cat_name}:", attr)
             y += 1
             
             # Settings for this category
-            settings = self.settings.get_game_settings(category)
-            for set_idx, (key, value) in enumerate(settings.items()):
+            for set_idx, key in enumerate(self._keys_cache[category]):
                 is_selected = (cat_idx == self.current_category and set_idx == self.current_setting)
-                
-                # Format setting name
-                setting_name = key.replace('_', ' ').title()
-                
-                # Format value
-                if isinstance(value, bool):
-                    value_str = "ON" if value else "OFF"
-                elif isinstance(value, int):
-                    value_str = str(value)
-                else:
-                    value_str = value.upper()
+                label = self._rendered.get((category, key))
+                if label is None:
+                    label = self._format_setting(category, key)
+                    self._rendered[(category, key)] = label
                 
                 # Display
                 if is_selected:
-                    stdscr.addstr(y, 10, f"> {setting_name}: [{value_str}]", curses.A_REVERSE)
+                    stdscr.addstr(y, 10, f"> {label}", curses.A_REVERSE)
                 else:
-                    stdscr.addstr(y, 10, f"  {setting_name}: [{value_str}]")
+                    stdscr.addstr(y, 10, f"  {label}")
                 y += 1
             
             y += 1  # Space between categories
@@ -3,6 +3,7 @@
 import curses
 import random
 import time
+from collections import deque
 from typing import List, Tuple
 from utils.base_game import BaseGame
 from utils.ui_helpers import draw_game_over_screen
@@ -15,7 +16,9 @@ class SnakeGame(BaseGame):
         super().__init__('snake', min_height=24, min_width=80)
         
         self.direction = (1, 0)  # Right
-        self.snake = [(10, 10), (10, 9), (10, 8)]
+        self.snake = deque([(10, 10), (10, 9), (10, 8)])
+        # Cells covered by the snake, for O(1) collision and food checks
+        self._occupied = set(self.snake)
         self.food = None
         
         # Base speed, adjusted by settings
@@ -29,6 +32,8 @@ class SnakeGame(BaseGame):
     
     def _init_game(self):
         """Initialize game state."""
+        # Blank board interior row, the template for rows the snake is on
+        self._blank_row = b' ' * (self.width - 2)
         self._spawn_food()
     
     def _spawn_food(self):
@@ -36,7 +41,7 @@ class SnakeGame(BaseGame):
         while True:
             food_y = random.randint(1, self.height - 2)
             food_x = random.randint(1, self.width - 2)
-            if (food_y, food_x) not in self.snake:
+            if (food_y, food_x) not in self._occupied:
                 self.food = (food_y, food_x)
                 break
     
@@ -58,13 +63,15 @@ class SnakeGame(BaseGame):
     
     def _update_game(self, delta_time: float):
         """Update game state."""
-        # Move snake at fixed intervals
+        # Move snake at fixed intervals, keeping the leftover time and
+        # catching up with extra steps after a slow frame
         self.last_move_time += delta_time
-        if self.last_move_time < self.game_speed:
-            return
-        self.last_move_time = 0
-        
-        # Move snake
+        while self.last_move_time >= self.game_speed and not self.game_over:
+            self.last_move_time -= self.game_speed
+            self._move_snake()
+    
+    def _move_snake(self):
+        """Advance the snake one cell."""
         head_y, head_x = self.snake[0]
         new_head = (head_y + self.direction[0], head_x + self.direction[1])
         
@@ -75,48 +82,63 @@ class SnakeGame(BaseGame):
             return
         
         # Check self collision
-        if new_head in self.snake:
+        if new_head in self._occupied:
             self.game_over = True
             return
         
-        self.snake.insert(0, new_head)
+        self.snake.appendleft(new_head)
+        self._occupied.add(new_head)
         
         # Check food collision
         if new_head == self.food:
             self.score += 10
             self._spawn_food()
         else:
-            self.snake.pop()
+            self._occupied.discard(self.snake.pop())
     
     def _draw_game(self):
-        """Draw the game state."""
-        self.stdscr.clear()
+        """Draw the game state into the frame buffer and flush the changes."""
+        frame = self._begin_frame()
         
         # Draw border
-        self.stdscr.border(0)
+        frame.border()
+        
+        # Stamp the snake and food into one scratch row per occupied line,
+        # then emit each row's interior with a single addstr
+        rows = {}
+        for y, x in self.snake:
+            row = rows.get(y)
+            if row is None:
+                row = rows[y] = bytearray(self._blank_row)
+            row[x - 1] = ord('o')
+        head_y, head_x = self.snake[0]
+        rows[head_y][head_x - 1] = ord('O')
+        if self.food:
+            food_y, food_x = self.food
+            row = rows.get(food_y)
+            if row is None:
+                row = rows[food_y] = bytearray(self._blank_row)
+            row[food_x - 1] = ord('*')
         
-        # Draw snake
-        for i, (y, x) in enumerate(self.snake):
-            if i == 0:
-                self.stdscr.addch(y, x, 'O', curses.A_BOLD)  # Head
-            else:
-                self.stdscr.addch(y, x, 'o')
+        for y, row in rows.items():
+            frame.addstr(y, 1, row.decode())
         
-        # Draw food
+        # Bold the head and food in place
+        frame.chgat(head_y, head_x, 1, curses.A_BOLD)
         if self.food:
-            self.stdscr.addch(self.food[0], self.food[1], '*', curses.A_BOLD)
+            frame.chgat(food_y, food_x, 1, curses.A_BOLD)
         
         # Draw info bar
-        self._draw_info_bar()
+        self._draw_info_bar(win=frame)
         
         # Draw controls
         controls = "Q: Quit | P: Pause | Arrow Keys: Move"
-        self.stdscr.addstr(0, self.width - len(controls) - 1, controls)
+        frame.addstr(0, self.width - len(controls) - 1, controls)
         
         # Draw pause message
-        self._draw_pause_message()
+        self._draw_pause_message(frame)
         
-        self.stdscr.refresh()
+        self._end_frame()
     
     def _draw_game_over(self, is_new_high: bool = False):
         """Draw game over screen."""
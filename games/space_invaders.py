@@ -2,11 +2,22 @@
 
 import curses
 import random
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 from utils.base_game import BaseGame
 from utils.ui_helpers import draw_game_over_screen
 
 
+# Starting enemy formation: 3 rows of 8, five columns apart
+FORMATION_Y = tuple(2 + row for row in range(3) for col in range(8))
+FORMATION_X = tuple(5 + col * 5 for row in range(3) for col in range(8))
+
+
+def _keep_where(keep: List[bool], *columns: List[int]):
+    """Filter parallel columns in place, keeping entries whose flag is set."""
+    for column in columns:
+        column[:] = [value for value, kept in zip(column, keep) if kept]
+
+
 class SpaceInvadersGame(BaseGame):
     """Space Invaders game for the terminal."""
     
@@ -16,21 +27,32 @@ class SpaceInvadersGame(BaseGame):
         self.board_width = 50
         self.board_height = 20
         
+        # Top and bottom border rows never change
+        self._h_border = '-' * (self.board_width + 2)
+        
         # Player
         self.player_x = self.board_width // 2
         self.player_y = self.board_height - 2
         
-        # Bullets
-        self.bullets = []
+        # Player bullets as parallel lists (row, column per bullet)
+        self.bullets_y: List[int] = []
+        self.bullets_x: List[int] = []
         
-        # Enemies
-        self.enemies = []
+        # Enemies as parallel lists (row, column, alive flag per enemy)
+        self.enemies_y: List[int] = []
+        self.enemies_x: List[int] = []
+        self.enemies_alive: List[bool] = []
+        # (row, column) -> index of each live enemy; None until next needed
+        self._enemy_grid: Optional[Dict[Tuple[int, int], int]] = None
+        # Leftmost and rightmost live enemy columns; None until next needed
+        self._enemy_span: Optional[Tuple[int, int]] = None
         self.enemy_direction = 1
         self.enemy_speed = 0.3
         self.enemy_move_timer = 0
         
-        # Enemy bullets
-        self.enemy_bullets = []
+        # Enemy bullets, same layout as the player's
+        self.enemy_bullets_y: List[int] = []
+        self.enemy_bullets_x: List[int] = []
         self.enemy_shoot_timer = 0
         
         # Game state
@@ -46,17 +68,11 @@ class SpaceInvadersGame(BaseGame):
     
     def _spawn_enemies(self):
         """Spawn enemies in formation."""
-        self.enemies = []
-        rows = 3
-        cols = 8
-        start_y = 2
-        start_x = 5
-        
-        for row in range(rows):
-            for col in range(cols):
-                y = start_y + row
-                x = start_x + col * 5
-                self.enemies.append({'y': y, 'x': x, 'alive': True})
+        self.enemies_y = list(FORMATION_Y)
+        self.enemies_x = list(FORMATION_X)
+        self.enemies_alive = [True] * len(FORMATION_Y)
+        self._enemy_grid = None
+        self._enemy_span = None
     
     def _move_enemies(self, delta_time: float):
         """Move enemies and handle direction changes."""
@@ -64,85 +80,120 @@ class SpaceInvadersGame(BaseGame):
         if self.enemy_move_timer >= self.enemy_speed:
             self.enemy_move_timer = 0
             
-            change_dir = False
-            for enemy in self.enemies:
-                if not enemy['alive']:
-                    continue
-                if (self.enemy_direction == 1 and enemy['x'] >= self.board_width - 2) or \
-                   (self.enemy_direction == -1 and enemy['x'] <= 1):
-                    change_dir = True
-                    break
+            span = self._get_enemy_span()
+            if span is None:
+                return
+            left, right = span
+            change_dir = ((self.enemy_direction == 1 and right >= self.board_width - 2) or
+                          (self.enemy_direction == -1 and left <= 1))
             
+            # Dead enemies shift too; they are never drawn or hit
+            self._enemy_grid = None  # Formation moves either way
             if change_dir:
                 self.enemy_direction *= -1
-                for enemy in self.enemies:
-                    if enemy['alive']:
-                        enemy['y'] += 1
-                        if enemy['y'] >= self.player_y:
-                            self.game_over = True
+                self.enemies_y = [y + 1 for y in self.enemies_y]
+                if any(alive and y >= self.player_y
+                       for y, alive in zip(self.enemies_y, self.enemies_alive)):
+                    self.game_over = True
             else:
-                for enemy in self.enemies:
-                    if enemy['alive']:
-                        enemy['x'] += self.enemy_direction
+                step = self.enemy_direction
+                self.enemies_x = [x + step for x in self.enemies_x]
+                self._enemy_span = (left + step, right + step)
+    
+    def _get_enemy_span(self) -> Optional[Tuple[int, int]]:
+        """Return the (leftmost, rightmost) live enemy columns, or None.
+        
+        The whole formation shifts together, so the span is only rescanned
+        after a kill or respawn and otherwise moves with the formation.
+        """
+        if self._enemy_span is None:
+            alive_xs = [x for x, alive in zip(self.enemies_x, self.enemies_alive) if alive]
+            if alive_xs:
+                self._enemy_span = (min(alive_xs), max(alive_xs))
+        return self._enemy_span
     
     def _update_bullets(self):
         """Update player bullets."""
-        new_bullets = []
-        for bullet in self.bullets:
-            y, x = bullet
-            y -= 1
-            if y > 0:
-                new_bullets.append((y, x))
-        self.bullets = new_bullets
+        ys = self.bullets_y
+        for i in range(len(ys)):
+            ys[i] -= 1
+        # Rebuild the lists only when a bullet has left the board
+        if ys and min(ys) <= 0:
+            _keep_where([y > 0 for y in ys], self.bullets_y, self.bullets_x)
     
     def _update_enemy_bullets(self):
         """Update enemy bullets."""
-        new_bullets = []
-        for bullet in self.enemy_bullets:
-            y, x = bullet
-            y += 1
-            if y < self.board_height:
-                new_bullets.append((y, x))
-        self.enemy_bullets = new_bullets
+        ys = self.enemy_bullets_y
+        for i in range(len(ys)):
+            ys[i] += 1
+        if ys and max(ys) >= self.board_height:
+            _keep_where([y < self.board_height for y in ys],
+                        self.enemy_bullets_y, self.enemy_bullets_x)
+    
+    def _get_enemy_grid(self) -> Dict[Tuple[int, int], int]:
+        """Return a map from (row, column) to the index of each live enemy.
+        
+        Rebuilt only after the formation moves or respawns; kills delete
+        their own entry. Built in reverse so the lowest index wins a cell.
+        """
+        if self._enemy_grid is None:
+            ys, xs, alive = self.enemies_y, self.enemies_x, self.enemies_alive
+            self._enemy_grid = {
+                (ys[i], xs[i]): i for i in reversed(range(len(alive))) if alive[i]
+            }
+        return self._enemy_grid
     
     def _check_collisions(self):
         """Check for collisions."""
-        bullets_to_remove = []
-        for i, bullet in enumerate(self.bullets):
-            by, bx = bullet
-            for enemy in self.enemies:
-                if not enemy['alive']:
-                    continue
-                if abs(enemy['y'] - by) < 1 and abs(enemy['x'] - bx) < 2:
-                    enemy['alive'] = False
-                    bullets_to_remove.append(i)
-                    self.score += 10
-                    break
-        
-        for i in sorted(bullets_to_remove, reverse=True):
-            self.bullets.pop(i)
-        
-        for bullet in self.enemy_bullets:
-            by, bx = bullet
-            if abs(self.player_y - by) < 1 and abs(self.player_x - bx) < 2:
-                self.lives -= 1
-                self.enemy_bullets.remove(bullet)
-                if self.lives <= 0:
-                    self.game_over = True
+        keep = None
+        grid = self._get_enemy_grid()
+        for i, (by, bx) in enumerate(zip(self.bullets_y, self.bullets_x)):
+            # A hit needs the same row and a column within one of the bullet
+            hits = [j for j in (grid.get((by, bx - 1)), grid.get((by, bx)),
+                                grid.get((by, bx + 1))) if j is not None]
+            if hits:
+                j = min(hits)
+                self.enemies_alive[j] = False
+                self._enemy_span = None
+                del grid[(self.enemies_y[j], self.enemies_x[j])]
+                if keep is None:
+                    keep = [True] * len(self.bullets_y)
+                keep[i] = False
+                self.score += 10
+        
+        if keep is not None:
+            _keep_where(keep, self.bullets_y, self.bullets_x)
+        
+        # Enemy bullets can only hit on the player's row
+        if self.player_y not in self.enemy_bullets_y:
+            return
+        py, px = self.player_y, self.player_x
+        keep = [not (by == py and abs(px - bx) < 2)
+                for by, bx in zip(self.enemy_bullets_y, self.enemy_bullets_x)]
+        hits = keep.count(False)
+        if hits:
+            self.lives -= hits
+            _keep_where(keep, self.enemy_bullets_y, self.enemy_bullets_x)
+            if self.lives <= 0:
+                self.game_over = True
     
     def _enemy_shoot(self, delta_time: float):
         """Make enemies shoot randomly."""
         self.enemy_shoot_timer += delta_time
         if self.enemy_shoot_timer >= 1.0:
             self.enemy_shoot_timer = 0
-            alive_enemies = [e for e in self.enemies if e['alive']]
-            if alive_enemies and random.random() < 0.3:
-                enemy = random.choice(alive_enemies)
-                self.enemy_bullets.append((enemy['y'] + 1, enemy['x']))
+            # Roll first so the live-enemy list is only built when firing
+            if random.random() >= 0.3:
+                return
+            alive_enemies = [i for i, alive in enumerate(self.enemies_alive) if alive]
+            if alive_enemies:
+                i = random.choice(alive_enemies)
+                self.enemy_bullets_y.append(self.enemies_y[i] + 1)
+                self.enemy_bullets_x.append(self.enemies_x[i])
     
     def _check_win(self):
         """Check if all enemies are destroyed."""
-        if all(not enemy['alive'] for enemy in self.enemies):
+        if not any(self.enemies_alive):
             self.won = True
             self.game_over = True
     
@@ -158,8 +209,9 @@ class SpaceInvadersGame(BaseGame):
             elif key == curses.KEY_RIGHT or key == ord('d'):
                 self.player_x = min(self.board_width - 2, self.player_x + 1)
             elif key == ord(' ') or key == ord('\n'):
-                if len(self.bullets) < 3:
-                    self.bullets.append((self.player_y - 1, self.player_x))
+                if len(self.bullets_y) < 3:
+                    self.bullets_y.append(self.player_y - 1)
+                    self.bullets_x.append(self.player_x)
         return True
     
     def _update_game(self, delta_time: float):
@@ -175,39 +227,40 @@ class SpaceInvadersGame(BaseGame):
         self._check_win()
     
     def _draw_game(self):
-        """Draw the game state."""
-        self.stdscr.clear()
+        """Draw the game state into the frame buffer and flush the changes."""
+        frame = self._begin_frame()
         
         board_start_y = 2
         board_start_x = (self.width - self.board_width) // 2
         
         # Border
-        for y in range(self.board_height + 2):
-            self.stdscr.addch(board_start_y + y, board_start_x - 1, '|')
-            self.stdscr.addch(board_start_y + y, board_start_x + self.board_width, '|')
-        for x in range(self.board_width + 2):
-            self.stdscr.addch(board_start_y - 1, board_start_x - 1 + x, '-')
-            self.stdscr.addch(board_start_y + self.board_height, board_start_x - 1 + x, '-')
+        frame.addstr(board_start_y - 1, board_start_x - 1, self._h_border)
+        frame.vline(board_start_y, board_start_x - 1, '|', self.board_height)
+        frame.vline(board_start_y, board_start_x + self.board_width, '|', self.board_height)
+        frame.addstr(board_start_y + self.board_height, board_start_x - 1, self._h_border)
+        
+        # Sprites: bind the per-cell lookups once for the loops below
+        addch = frame.addch
+        bold = curses.A_BOLD
         
         # Draw enemies
-        for enemy in self.enemies:
-            if enemy['alive']:
-                self.stdscr.addch(board_start_y + enemy['y'], board_start_x + enemy['x'], '^', 
-                                curses.A_BOLD)
+        for y, x, alive in zip(self.enemies_y, self.enemies_x, self.enemies_alive):
+            if alive:
+                addch(board_start_y + y, board_start_x + x, '^', bold)
         
         # Draw player
-        self.stdscr.addch(board_start_y + self.player_y, board_start_x + self.player_x, 'A', 
-                        curses.A_BOLD)
+        addch(board_start_y + self.player_y, board_start_x + self.player_x, 'A', bold)
         
         # Draw bullets
-        for by, bx in self.bullets:
-            self.stdscr.addch(board_start_y + by, board_start_x + bx, '|', curses.A_BOLD)
+        for by, bx in zip(self.bullets_y, self.bullets_x):
+            addch(board_start_y + by, board_start_x + bx, '|', bold)
         
-        for by, bx in self.enemy_bullets:
-            self.stdscr.addch(board_start_y + by, board_start_x + bx, '.', curses.A_DIM)
+        dim = curses.A_DIM
+        for by, bx in zip(self.enemy_bullets_y, self.enemy_bullets_x):
+            addch(board_start_y + by, board_start_x + bx, '.', dim)
         
         # Info
-        self._draw_info_bar({'Lives': self.lives})
+        self._draw_info_bar({'Lives': self.lives}, frame)
         
         # Instructions
         inst_y = board_start_y + self.board_height + 2
@@ -218,12 +271,12 @@ class SpaceInvadersGame(BaseGame):
             "Q: Quit"
         ]
         for i, inst in enumerate(instructions):
-            self.stdscr.addstr(inst_y + i, 2, inst)
+            frame.addstr(inst_y + i, 2, inst)
         
         # Pause message
-        self._draw_pause_message()
+        self._draw_pause_message(frame)
         
-        self.stdscr.refresh()
+        self._end_frame()
     
     def _get_game_state(self) -> Dict[str, Any]:
         """Get game state for achievements."""
@@ -2,21 +2,70 @@
 
 import curses
 import random
+import time
 from typing import List, Tuple, Optional, Dict, Any
 from utils.base_game import BaseGame
 from utils.ui_helpers import draw_game_over_screen
 
+# Cells filled by backtracking as (cell, row, column, box), where cell is
+# the flat index row * 9 + col: everything outside the three diagonal
+# boxes, which are filled first since they share no unit
+FILL_CELLS = tuple((row * 9 + col, row, col, row // 3 * 3 + col // 3)
+                   for row in range(9) for col in range(9)
+                   if row // 3 != col // 3)
+
+# Horizontal grid lines, thick around boxes; vertical box separators are
+# drawn alongside the cells
+GRID_LINES = tuple(('═' if i % 3 == 0 else '─') * 37 for i in range(10))
+
+# Blank board, and a translate() table mapping filled cells to 1 and
+# empty ones to 0 for deriving the fixed flags
+EMPTY_BOARD = bytes(81)
+FILLED_TABLE = bytes([0] + [1] * 255)
+
+
+def _to_rows(cells: bytearray, kind=int) -> List[list]:
+    """Split a flat 81-cell board into nine row lists for saving."""
+    return [[kind(v) for v in cells[row * 9:row * 9 + 9]] for row in range(9)]
+
+
+def _from_rows(rows: Optional[List[list]]) -> bytearray:
+    """Flatten nine saved row lists back into an 81-cell board.
+    
+    A missing entry (None) gives an empty board.
+    """
+    if rows is None:
+        return bytearray(81)
+    return bytearray(v for row in rows for v in row)
+
 
 class SudokuGame(BaseGame):
     """Sudoku number puzzle game."""
     
+    INSTRUCTIONS = (
+        "Arrow Keys: Move cursor",
+        "1-9: Place number",
+        "0/Space: Clear cell",
+        "H: Use hint",
+        "P: Pause | Q: Quit",
+    )
+    
     def __init__(self):
         super().__init__('sudoku', min_height=24, min_width=80)
         
-        # Grid state
-        self.grid = [[0 for _ in range(9)] for _ in range(9)]
-        self.solution = [[0 for _ in range(9)] for _ in range(9)]
-        self.fixed = [[False for _ in range(9)] for _ in range(9)]
+        # Grid state: flat 81-cell boards indexed row * 9 + col; 0 = empty
+        self.grid = bytearray(81)
+        self.solution = bytearray(81)
+        # Fixed: 1 = given in the puzzle, not editable
+        self.fixed = bytearray(81)
+        # Cells whose value differs from the solution (empty or wrong)
+        self._cells_left = 81
+        
+        # Screen layout, recomputed in _draw_game when the width changes
+        self._layout_width = -1
+        self._title_x = 0
+        self._grid_start_x = 0
+        self._cell_xs: Tuple[int, ...] = ()
         
         # Cursor position
         self.cursor_row = 0
@@ -33,105 +82,91 @@ class SudokuGame(BaseGame):
         self.cells_to_remove = {'easy': 30, 'normal': 40, 'hard': 50}.get(difficulty, 40)
     
     def _get_input_timeout(self) -> int:
-        return 100
+        # Turn-based with nothing animated, so block until a key arrives
+        return -1
     
     def _init_game(self):
         """Initialize the game."""
         self._generate_puzzle()
-        self.game_start_time = __import__('time').time()
+        self.game_start_time = time.time()
+        # The loop draws after each key, so show the board before the first
+        self._draw_game()
     
     def _generate_puzzle(self):
         """Generate a Sudoku puzzle."""
-        # Start with empty grid
-        self.grid = [[0 for _ in range(9)] for _ in range(9)]
+        # Start with empty grid, clearing the existing boards in place
+        self.grid[:] = EMPTY_BOARD
+        # Digits placed per row, column and box while filling the solution,
+        # as bitmasks where bit n-1 is set iff digit n is present
+        masks = ([0] * 9, [0] * 9, [0] * 9)
         
         # Fill diagonal 3x3 boxes (they don't depend on each other)
         for box in range(0, 9, 3):
-            self._fill_box(box, box)
+            self._fill_box(box, box, masks)
         
         # Fill remaining cells
-        self._fill_remaining(0, 3)
+        self._fill_remaining(0, *masks)
         
         # Copy to solution
-        self.solution = [row[:] for row in self.grid]
+        self.solution[:] = self.grid
         
         # Remove cells to create puzzle
         self._remove_cells()
         
         # Mark fixed cells
-        for i in range(9):
-            for j in range(9):
-                self.fixed[i][j] = (self.grid[i][j] != 0)
+        self.fixed[:] = self.grid.translate(FILLED_TABLE)
+        self._cells_left = self.cells_to_remove
     
-    def _fill_box(self, row: int, col: int):
+    def _fill_box(self, row: int, col: int, masks: Tuple[List[int], List[int], List[int]]):
         """Fill a 3x3 box with random valid numbers."""
         nums = list(range(1, 10))
         random.shuffle(nums)
         
+        row_mask, col_mask, box_mask = masks
         idx = 0
         for i in range(3):
             for j in range(3):
-                self.grid[row + i][col + j] = nums[idx]
+                num = nums[idx]
+                bit = 1 << (num - 1)
+                self.grid[(row + i) * 9 + col + j] = num
+                row_mask[row + i] |= bit
+                col_mask[col + j] |= bit
+                box_mask[row // 3 * 3 + col // 3] |= bit
                 idx += 1
     
-    def _fill_remaining(self, row: int, col: int) -> bool:
-        """Fill remaining cells recursively."""
-        if col >= 9 and row < 8:
-            row += 1
-            col = 0
-        if row >= 9 and col >= 9:
+    def _fill_remaining(self, index: int, row_mask: List[int],
+                        col_mask: List[int], box_mask: List[int]) -> bool:
+        """Fill FILL_CELLS[index:] recursively, trying digits in order."""
+        if index == len(FILL_CELLS):
             return True
         
-        if row < 3:
-            if col < 3:
-                col = 3
-        elif row < 6:
-            if col == int(row // 3) * 3:
-                col += 3
-        else:
-            if col == 6:
-                row += 1
-                col = 0
-                if row >= 9:
-                    return True
-        
+        cell, row, col, box = FILL_CELLS[index]
+        grid = self.grid
+        # Digits already in the cell's row, column or box, computed once for
+        # all nine tries
+        used = row_mask[row] | col_mask[col] | box_mask[box]
         for num in range(1, 10):
-            if self._is_safe(row, col, num):
-                self.grid[row][col] = num
-                if self._fill_remaining(row, col + 1):
-                    return True
-                self.grid[row][col] = 0
-        
+            bit = 1 << (num - 1)
+            if used & bit:
+                continue
+            grid[cell] = num
+            row_mask[row] |= bit
+            col_mask[col] |= bit
+            box_mask[box] |= bit
+            if self._fill_remaining(index + 1, row_mask, col_mask, box_mask):
+                return True
+            row_mask[row] ^= bit
+            col_mask[col] ^= bit
+            box_mask[box] ^= bit
+        
+        grid[cell] = 0
         return False
     
-    def _is_safe(self, row: int, col: int, num: int) -> bool:
-        """Check if number can be placed at position."""
-        # Check row
-        if num in self.grid[row]:
-            return False
-        
-        # Check column
-        if num in [self.grid[i][col] for i in range(9)]:
-            return False
-        
-        # Check 3x3 box
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if self.grid[i][j] == num:
-                    return False
-        
-        return True
-    
     def _remove_cells(self):
         """Remove cells to create puzzle."""
-        count = self.cells_to_remove
-        while count > 0:
-            row = random.randint(0, 8)
-            col = random.randint(0, 8)
-            if self.grid[row][col] != 0:
-                self.grid[row][col] = 0
-                count -= 1
+        # The solved grid has no empty cells, so any distinct picks will do
+        for cell in random.sample(range(81), self.cells_to_remove):
+            self.grid[cell] = 0
     
     def _handle_input(self, key: int) -> bool:
         """Handle input."""
@@ -152,12 +187,13 @@ class SudokuGame(BaseGame):
             
             # Number input
             elif key >= ord('1') and key <= ord('9'):
-                if not self.fixed[self.cursor_row][self.cursor_col]:
+                cell = self.cursor_row * 9 + self.cursor_col
+                if not self.fixed[cell]:
                     num = int(chr(key))
-                    self.grid[self.cursor_row][self.cursor_col] = num
+                    self._set_cell(cell, num)
                     
                     # Check if correct
-                    if num != self.solution[self.cursor_row][self.cursor_col]:
+                    if num != self.solution[cell]:
                         self.mistakes += 1
                         if self.mistakes >= self.max_mistakes:
                             self.game_over = True
@@ -170,30 +206,32 @@ class SudokuGame(BaseGame):
             
             # Clear cell
             elif key == ord(' ') or key == ord('0') or key == curses.KEY_BACKSPACE:
-                if not self.fixed[self.cursor_row][self.cursor_col]:
-                    self.grid[self.cursor_row][self.cursor_col] = 0
+                cell = self.cursor_row * 9 + self.cursor_col
+                if not self.fixed[cell]:
+                    self._set_cell(cell, 0)
             
             # Hint
             elif key == ord('h'):
+                cell = self.cursor_row * 9 + self.cursor_col
                 if self.hints_used < self.max_hints:
-                    if not self.fixed[self.cursor_row][self.cursor_col]:
-                        self.grid[self.cursor_row][self.cursor_col] = \
-                            self.solution[self.cursor_row][self.cursor_col]
+                    if not self.fixed[cell]:
+                        self._set_cell(cell, self.solution[cell])
                         self.hints_used += 1
         
         return True
     
+    def _set_cell(self, cell: int, num: int):
+        """Write a player's value, keeping the unsolved cell count in step."""
+        answer = self.solution[cell]
+        self._cells_left += (self.grid[cell] == answer) - (num == answer)
+        self.grid[cell] = num
+    
     def _check_complete(self) -> bool:
         """Check if puzzle is complete and correct."""
-        for i in range(9):
-            for j in range(9):
-                if self.grid[i][j] != self.solution[i][j]:
-                    return False
-        return True
+        return self._cells_left == 0
     
     def _calculate_score(self):
         """Calculate final score."""
-        import time
         elapsed = time.time() - self.game_start_time
         
         # Base score
@@ -215,86 +253,78 @@ class SudokuGame(BaseGame):
         pass  # Sudoku is turn-based
     
     def _draw_game(self):
-        """Draw the game."""
-        self.stdscr.clear()
-        self.stdscr.border(0)
+        """Draw the game state into the frame buffer and flush the changes."""
+        frame = self._begin_frame()
+        frame.border()
+        
+        if self.width != self._layout_width:
+            self._title_x = (self.width - len("SUDOKU")) // 2
+            self._grid_start_x = (self.width - 37) // 2
+            self._cell_xs = tuple(self._grid_start_x + j * 4 + 2 for j in range(9))
+            self._layout_width = self.width
         
         # Title
-        title = "SUDOKU"
-        title_x = (self.width - len(title)) // 2
-        self.stdscr.addstr(1, title_x, title, curses.A_BOLD)
+        frame.addstr(1, self._title_x, "SUDOKU", curses.A_BOLD)
         
         # Draw grid
         grid_start_y = 4
-        grid_start_x = (self.width - 37) // 2
+        grid_start_x = self._grid_start_x
         
         # Grid lines
-        for i in range(10):
-            # Horizontal lines
-            y = grid_start_y + i * 2
-            char = '═' if i % 3 == 0 else '─'
-            line = char * 37
-            if i < 10:
-                self.stdscr.addstr(y, grid_start_x, line)
-            
-            # Vertical lines (drawn with cells)
-        
-        # Draw cells
+        for i, line in enumerate(GRID_LINES):
+            frame.addstr(grid_start_y + i * 2, grid_start_x, line)
+        
+        # Draw cells, with the per-cell lookups bound once for the loop
+        addstr = frame.addstr
+        grid, fixed, solution = self.grid, self.fixed, self.solution
+        normal, reverse = curses.A_NORMAL, curses.A_REVERSE
+        bold, dim = curses.A_BOLD, curses.A_DIM
+        cursor = self.cursor_row * 9 + self.cursor_col
         for i in range(9):
-            for j in range(9):
-                cell_y = grid_start_y + i * 2 + 1
-                cell_x = grid_start_x + j * 4 + 2
+            cell_y = grid_start_y + i * 2 + 1
+            for j, cell_x in enumerate(self._cell_xs):
+                cell = i * 9 + j
                 
                 # Cell value
-                num = self.grid[i][j]
+                num = grid[cell]
                 
                 # Determine attribute
-                attr = curses.A_NORMAL
-                if i == self.cursor_row and j == self.cursor_col:
-                    attr = curses.A_REVERSE
+                attr = reverse if cell == cursor else normal
                 
-                if self.fixed[i][j]:
-                    attr |= curses.A_BOLD
-                elif num != 0 and num != self.solution[i][j]:
-                    attr |= curses.A_DIM  # Wrong number
+                if fixed[cell]:
+                    attr |= bold
+                elif num != 0 and num != solution[cell]:
+                    attr |= dim  # Wrong number
                 
                 # Draw
                 display = str(num) if num != 0 else " "
-                self.stdscr.addstr(cell_y, cell_x, display, attr)
+                addstr(cell_y, cell_x, display, attr)
                 
                 # Vertical separators
                 if j % 3 == 2 and j < 8:
-                    self.stdscr.addstr(cell_y, cell_x + 2, "║")
+                    addstr(cell_y, cell_x + 2, "║")
         
         # Info
         info_y = grid_start_y + 19
         info_x = 5
         
-        self.stdscr.addstr(info_y, info_x, f"Mistakes: {self.mistakes}/{self.max_mistakes}")
+        frame.addstr(info_y, info_x, f"Mistakes: {self.mistakes}/{self.max_mistakes}")
         info_y += 1
-        self.stdscr.addstr(info_y, info_x, f"Hints Available: {self.max_hints - self.hints_used}")
+        frame.addstr(info_y, info_x, f"Hints Available: {self.max_hints - self.hints_used}")
         
         # Instructions
         inst_y = info_y + 2
-        instructions = [
-            "Arrow Keys: Move cursor",
-            "1-9: Place number",
-            "0/Space: Clear cell",
-            "H: Use hint",
-            "P: Pause | Q: Quit"
-        ]
-        for i, inst in enumerate(instructions):
-            self.stdscr.addstr(inst_y + i, info_x, inst, curses.A_DIM)
+        for i, inst in enumerate(self.INSTRUCTIONS):
+            frame.addstr(inst_y + i, info_x, inst, curses.A_DIM)
         
         # Pause message
-        self._draw_pause_message()
+        self._draw_pause_message(frame)
         
-        self.stdscr.refresh()
+        self._end_frame()
     
     def _get_game_state(self) -> Dict[str, Any]:
         """Get game state for achievements."""
         state = super()._get_game_state()
-        import time
         state.update({
             'mistakes': self.mistakes,
             'hints_used': self.hints_used,
@@ -306,9 +336,9 @@ class SudokuGame(BaseGame):
         """Serialize game state for saving."""
         state = super()._serialize_state()
         state.update({
-            'grid': self.grid,
-            'solution': self.solution,
-            'fixed': self.fixed,
+            'grid': _to_rows(self.grid),
+            'solution': _to_rows(self.solution),
+            'fixed': _to_rows(self.fixed, bool),
             'cursor_row': self.cursor_row,
             'cursor_col': self.cursor_col,
             'mistakes': self.mistakes,
@@ -320,14 +350,16 @@ class SudokuGame(BaseGame):
     def _deserialize_state(self, state: Dict[str, Any]):
         """Deserialize and restore game state."""
         super()._deserialize_state(state)
-        self.grid = state.get('grid', [[0]*9 for _ in range(9)])
-        self.solution = state.get('solution', [[0]*9 for _ in range(9)])
-        self.fixed = state.get('fixed', [[False]*9 for _ in range(9)])
+        self.grid = _from_rows(state.get('grid'))
+        self.solution = _from_rows(state.get('solution'))
+        self.fixed = _from_rows(state.get('fixed'))
+        self._cells_left = sum(1 for num, answer in zip(self.grid, self.solution)
+                               if num != answer)
         self.cursor_row = state.get('cursor_row', 0)
         self.cursor_col = state.get('cursor_col', 0)
         self.mistakes = state.get('mistakes', 0)
         self.hints_used = state.get('hints_used', 0)
-        self.game_start_time = state.get('game_start_time', __import__('time').time())
+        self.game_start_time = state.get('game_start_time', time.time())
     
     def _draw_game_over(self, is_new_high: bool = False):
         """Draw game over screen."""
@@ -336,7 +368,6 @@ class SudokuGame(BaseGame):
         else:
             title = "GAME OVER"
         
-        import time
         elapsed = time.time() - self.game_start_time if self.game_start_time else 0
         
         extra_info = [
@@ -45,6 +45,38 @@ TETROMINOES = {
 }
 
 
+def _to_bitboard(cells: List[Tuple[int, int]]) -> Tuple[Tuple[int, ...], int, int]:
+    """Turn a rotation's (dy, dx) cells into (row masks, left, width).
+
+    Masks are shifted so the leftmost filled column is bit 0; left is that
+    column's offset from the piece position. Leading empty rows are kept as
+    zero masks so the piece sits where its cell list put it.
+    """
+    left = min(dx for _, dx in cells)
+    masks = [0] * (max(dy for dy, _ in cells) + 1)
+    for dy, dx in cells:
+        masks[dy] |= 1 << (dx - left)
+    width = max(dx for _, dx in cells) - left + 1
+    return tuple(masks), left, width
+
+
+# Every rotation as row bitmasks, so checks and locks work a row at a time
+TETROMINO_MASKS = {
+    name: [_to_bitboard(cells) for cells in rotations]
+    for name, rotations in TETROMINOES.items()
+}
+TETROMINO_KEYS = tuple(TETROMINOES)
+
+# Seconds per row by level, from the NES gravity curve (frames per row at
+# 60 Hz); levels past the end keep the last delay
+FALL_DELAYS = tuple(frames / 60 for frames in (
+    48, 43, 38, 33, 28, 23, 18, 13, 8, 6,
+    5, 5, 5, 4, 4, 4, 3, 3, 3,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    1,
+))
+
+
 class TetrisGame(BaseGame):
     """Classic Tetris game for the terminal."""
     
@@ -53,7 +85,12 @@ class TetrisGame(BaseGame):
         
         self.board_width = 10
         self.board_height = 20
-        self.board = [[0 for _ in range(self.board_width)] for _ in range(self.board_height)]
+        # One int per row, bit x set when column x is filled
+        self.board = [0] * self.board_height
+        self.full_row = (1 << self.board_width) - 1
+        
+        # Top and bottom border rows never change; cells are two columns wide
+        self._h_border = '-' * (self.board_width * 2 + 2)
         self.current_piece = None
         self.current_piece_type = None
         self.current_rotation = 0
@@ -64,11 +101,12 @@ class TetrisGame(BaseGame):
         self.level = starting_level
         self.lines_cleared = 0
         self.fall_time = 0
-        
-        # Base fall delay, adjusted by settings
-        base_delay = 0.5
-        speed_mult = self._get_game_speed()
-        self.fall_delay = base_delay * speed_mult
+        self.fall_delay = self._level_fall_delay()
+    
+    def _level_fall_delay(self) -> float:
+        """Fall delay for the current level, adjusted by settings."""
+        base_delay = FALL_DELAYS[min(self.level - 1, len(FALL_DELAYS) - 1)]
+        return base_delay * self._get_game_speed()
     
     def _get_input_timeout(self) -> int:
         return 50  # 50ms for responsive controls
@@ -79,10 +117,10 @@ class TetrisGame(BaseGame):
     
     def _spawn_piece(self):
         """Spawn a new tetromino at the top."""
-        piece_type = random.choice(list(TETROMINOES.keys()))
+        piece_type = random.choice(TETROMINO_KEYS)
         self.current_piece_type = piece_type
         self.current_rotation = 0
-        self.current_piece = TETROMINOES[piece_type][0]
+        self.current_piece = TETROMINO_MASKS[piece_type][0]
         # Start at top center
         self.current_pos = (0, self.board_width // 2 - 1)
         
@@ -97,11 +135,13 @@ class TetrisGame(BaseGame):
         if pos is None:
             pos = self.current_pos
         
-        for dy, dx in piece:
-            y, x = pos[0] + dy, pos[1] + dx
-            if x < 0 or x >= self.board_width or y >= self.board_height:
-                return False
-            if y >= 0 and self.board[y][x] != 0:
+        masks, left, width = piece
+        top, x = pos[0], pos[1] + left
+        if x < 0 or x + width > self.board_width or top + len(masks) > self.board_height:
+            return False
+        board = self.board
+        for y, mask in enumerate(masks, top):
+            if y >= 0 and board[y] & (mask << x):
                 return False
         return True
     
@@ -118,7 +158,7 @@ class TetrisGame(BaseGame):
     
     def _rotate_piece(self):
         """Rotate the current piece."""
-        rotations = TETROMINOES[self.current_piece_type]
+        rotations = TETROMINO_MASKS[self.current_piece_type]
         new_rotation = (self.current_rotation + 1) % len(rotations)
         new_piece = rotations[new_rotation]
         
@@ -132,34 +172,43 @@ class TetrisGame(BaseGame):
             self.current_piece = old_piece
             self.current_rotation = old_rotation
     
-    def _lock_piece(self):
-        """Lock the current piece into the board."""
-        for dy, dx in self.current_piece:
-            y, x = self.current_pos[0] + dy, self.current_pos[1] + dx
+    def _lock_piece(self) -> Tuple[int, int]:
+        """Lock the current piece into the board.
+        
+        Returns the first and last board rows the piece covers.
+        """
+        masks, left, _ = self.current_piece
+        top, x = self.current_pos[0], self.current_pos[1] + left
+        for y, mask in enumerate(masks, top):
             if y >= 0:
-                self.board[y][x] = 1
+                self.board[y] |= mask << x
+        return max(top, 0), top + len(masks) - 1
     
-    def _clear_lines(self):
-        """Clear completed lines and update score."""
-        lines_to_clear = []
-        for y in range(self.board_height):
-            if all(self.board[y][x] != 0 for x in range(self.board_width)):
-                lines_to_clear.append(y)
+    def _clear_lines(self, top: int = 0, bottom: Optional[int] = None):
+        """Clear completed lines and update score.
         
-        for y in lines_to_clear:
-            del self.board[y]
-            self.board.insert(0, [0 for _ in range(self.board_width)])
+        Only rows top..bottom are checked; a lock can only fill the rows
+        the piece covers.
+        """
+        if bottom is None:
+            bottom = self.board_height - 1
+        board = self.board
+        rows = board[top:bottom + 1]
+        kept = [row for row in rows if row != self.full_row]
+        cleared = len(rows) - len(kept)
+        if not cleared:
+            return
         
-        if lines_to_clear:
-            self.lines_cleared += len(lines_to_clear)
-            # Score: 100 * lines^2 (more lines = exponentially more points)
-            self.score += 100 * len(lines_to_clear) ** 2
-            # Level up every 10 lines
-            self.level = self.lines_cleared // 10 + 1
-            # Increase speed with level (but respect settings multiplier)
-            base_delay = max(0.1, 0.5 - (self.level - 1) * 0.05)
-            speed_mult = self._get_game_speed()
-            self.fall_delay = base_delay * speed_mult
+        # Drop full rows and add empty ones at the top
+        board[top:bottom + 1] = kept
+        board[:0] = [0] * cleared
+        self.lines_cleared += cleared
+        # Score: 100 * lines^2 (more lines = exponentially more points)
+        self.score += 100 * cleared ** 2
+        # Level up every 10 lines
+        self.level = self.lines_cleared // 10 + 1
+        # Increase speed with level (but respect settings multiplier)
+        self.fall_delay = self._level_fall_delay()
     
     def _handle_input(self, key: int) -> bool:
         """Handle input."""
@@ -174,8 +223,7 @@ class TetrisGame(BaseGame):
                 self._move_piece(0, 1)
             elif key == curses.KEY_DOWN:
                 if not self._move_piece(1, 0):
-                    self._lock_piece()
-                    self._clear_lines()
+                    self._clear_lines(*self._lock_piece())
                     self._spawn_piece()
             elif key == ord(' ') or key == curses.KEY_UP:
                 self._rotate_piece()
@@ -191,41 +239,43 @@ class TetrisGame(BaseGame):
         if self.fall_time >= self.fall_delay:
             self.fall_time = 0
             if not self._move_piece(1, 0):
-                self._lock_piece()
-                self._clear_lines()
+                self._clear_lines(*self._lock_piece())
                 self._spawn_piece()
     
     def _draw_game(self):
-        """Draw the game state."""
-        self.stdscr.clear()
+        """Draw the game state into the frame buffer and flush the changes."""
+        frame = self._begin_frame()
         
         board_start_y = 2
         board_start_x = (self.width - self.board_width * 2) // 2
         
         # Draw border around board
-        for y in range(self.board_height + 2):
-            self.stdscr.addch(board_start_y + y, board_start_x - 1, '|')
-            self.stdscr.addch(board_start_y + y, board_start_x + self.board_width * 2, '|')
-        for x in range(self.board_width * 2 + 2):
-            self.stdscr.addch(board_start_y - 1, board_start_x - 1 + x, '-')
-            self.stdscr.addch(board_start_y + self.board_height, board_start_x - 1 + x, '-')
+        frame.addstr(board_start_y - 1, board_start_x - 1, self._h_border)
+        frame.vline(board_start_y, board_start_x - 1, '|', self.board_height)
+        frame.vline(board_start_y, board_start_x + self.board_width * 2, '|', self.board_height)
+        frame.addstr(board_start_y + self.board_height, board_start_x - 1, self._h_border)
         
-        # Draw board
-        for y in range(self.board_height):
-            for x in range(self.board_width):
-                if self.board[y][x] != 0:
-                    self.stdscr.addstr(board_start_y + y, board_start_x + x * 2, '██')
+        # Draw board, one string per row
+        columns = range(self.board_width)
+        for y, row in enumerate(self.board):
+            if row:
+                text = ''.join('██' if (row >> x) & 1 else '  ' for x in columns)
+                frame.addstr(board_start_y + y, board_start_x, text)
         
         # Draw current piece
         if self.current_piece:
-            for dy, dx in self.current_piece:
-                py, px = self.current_pos[0] + dy, self.current_pos[1] + dx
-                if 0 <= py < self.board_height and 0 <= px < self.board_width:
-                    self.stdscr.addstr(board_start_y + py, board_start_x + px * 2, '██', curses.A_BOLD)
+            masks, left, width = self.current_piece
+            top, px = self.current_pos[0], self.current_pos[1] + left
+            for py, mask in enumerate(masks, top):
+                if py < 0:
+                    continue
+                for dx in range(width):
+                    if (mask >> dx) & 1:
+                        frame.addstr(board_start_y + py, board_start_x + (px + dx) * 2, '██', curses.A_BOLD)
         
         # Draw info
         info_x = board_start_x + self.board_width * 2 + 5
-        self._draw_info_bar({'Level': self.level, 'Lines': self.lines_cleared})
+        self._draw_info_bar({'Level': self.level, 'Lines': self.lines_cleared}, frame)
         
         # Draw controls
         controls = [
@@ -236,12 +286,12 @@ class TetrisGame(BaseGame):
             "Q: Quit"
         ]
         for i, control in enumerate(controls):
-            self.stdscr.addstr(10 + i, info_x, control)
+            frame.addstr(10 + i, info_x, control)
         
         # Draw pause message
-        self._draw_pause_message()
+        self._draw_pause_message(frame)
         
-        self.stdscr.refresh()
+        self._end_frame()
     
     def _get_game_state(self) -> Dict[str, Any]:
         """Get game state for achievements."""
@@ -7,6 +7,36 @@ from utils.base_game import BaseGame
 from utils.ui_helpers import draw_game_over_screen
 
 
+# Bit y * 3 + x of a player's bitboard marks cell (y, x). The masks cover the
+# three rows, three columns and two diagonals, written in octal so each digit
+# is one board row.
+WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+
+# Cursor row/column after stepping back or forward from the index position,
+# stopping at the board edge
+CURSOR_DEC = (0, 0, 1)
+CURSOR_INC = (1, 2, 2)
+
+
+def _has_line(bits: int) -> bool:
+    """Whether a bitboard covers any winning line."""
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+def _completing_cells(bits: int, occupied: int) -> int:
+    """Bitboard of free cells that would complete a line for bits."""
+    cells = 0
+    for mask in WIN_MASKS:
+        missing = mask & ~bits
+        # Exactly one cell of the line is missing and nobody has taken it
+        if missing & (missing - 1) == 0 and missing & ~occupied:
+            cells |= missing
+    return cells
+
+
 class TicTacToeGame(BaseGame):
     """Tic-Tac-Toe game for the terminal."""
     
@@ -22,6 +52,10 @@ class TicTacToeGame(BaseGame):
         self.winner = None
         self.moves_made = 0
         
+        # Seconds the AI waits before answering, and time waited so far
+        self.ai_delay = 0.3
+        self.ai_wait = 0.0
+        
         # AI difficulty from settings
         difficulty = self.settings.get('tictactoe', 'difficulty', 'normal')
         self.ai_level = {'easy': 0.3, 'normal': 0.7, 'hard': 1.0}.get(difficulty, 0.7)
@@ -37,6 +71,7 @@ class TicTacToeGame(BaseGame):
         self.cursor_y = 1
         self.winner = None
         self.moves_made = 0
+        self.ai_wait = 0.0
     
     def _handle_input(self, key: int) -> bool:
         """Handle player input."""
@@ -56,13 +91,13 @@ class TicTacToeGame(BaseGame):
             return True
         
         if key == curses.KEY_UP:
-            self.cursor_y = max(0, self.cursor_y - 1)
+            self.cursor_y = CURSOR_DEC[self.cursor_y]
         elif key == curses.KEY_DOWN:
-            self.cursor_y = min(2, self.cursor_y + 1)
+            self.cursor_y = CURSOR_INC[self.cursor_y]
         elif key == curses.KEY_LEFT:
-            self.cursor_x = max(0, self.cursor_x - 1)
+            self.cursor_x = CURSOR_DEC[self.cursor_x]
         elif key == curses.KEY_RIGHT:
-            self.cursor_x = min(2, self.cursor_x + 1)
+            self.cursor_x = CURSOR_INC[self.cursor_x]
         elif key == ord(' ') or key == ord('\n') or key == ord('\r'):
             # Place mark
             if self.board[self.cursor_y][self.cursor_x] == ' ':
@@ -94,10 +129,11 @@ class TicTacToeGame(BaseGame):
         """Update game state."""
         # If it's AI's turn, make a move
         if self.game_mode == 'ai' and self.current_player == 'O' and not self.game_over:
-            # Small delay for AI move
-            import time
-            time.sleep(0.3)
-            self._ai_move()
+            # Small delay for AI move, counted in frames so input stays live
+            self.ai_wait += delta_time
+            if self.ai_wait >= self.ai_delay:
+                self.ai_wait = 0.0
+                self._ai_move()
     
     def _ai_move(self):
         """Make an AI move."""
@@ -114,25 +150,17 @@ class TicTacToeGame(BaseGame):
     
     def _get_best_move(self) -> Optional[Tuple[int, int]]:
         """Get the best move using minimax algorithm."""
-        # Check for winning move
-        for y in range(3):
-            for x in range(3):
-                if self.board[y][x] == ' ':
-                    self.board[y][x] = 'O'
-                    if self._check_winner() == 'O':
-                        self.board[y][x] = ' '
-                        return (y, x)
-                    self.board[y][x] = ' '
+        bitboards = self._get_bitboards()
+        ai_bits = bitboards['O']
+        player_bits = bitboards['X']
+        occupied = ai_bits | player_bits
         
-        # Check for blocking move
-        for y in range(3):
-            for x in range(3):
-                if self.board[y][x] == ' ':
-                    self.board[y][x] = 'X'
-                    if self._check_winner() == 'X':
-                        self.board[y][x] = ' '
-                        return (y, x)
-                    self.board[y][x] = ' '
+        # Check for winning move, then for blocking move
+        for bits in (ai_bits, player_bits):
+            cells = _completing_cells(bits, occupied)
+            if cells:
+                # Lowest cell first, as a row-by-row scan would find it
+                return divmod((cells & -cells).bit_length() - 1, 3)
         
         # Take center if available
         if self.board[1][1] == ' ':
@@ -157,24 +185,20 @@ class TicTacToeGame(BaseGame):
                     available.append((y, x))
         return random.choice(available) if available else None
     
+    def _get_bitboards(self) -> Dict[str, int]:
+        """Each player's marks on the board as a 9-bit int."""
+        bitboards = {'X': 0, 'O': 0}
+        for y, row in enumerate(self.board):
+            for x, mark in enumerate(row):
+                if mark != ' ':
+                    bitboards[mark] |= 1 << (y * 3 + x)
+        return bitboards
+    
     def _check_winner(self) -> Optional[str]:
         """Check if there's a winner."""
-        # Check rows
-        for row in self.board:
-            if row[0] == row[1] == row[2] != ' ':
-                return row[0]
-        
-        # Check columns
-        for x in range(3):
-            if self.board[0][x] == self.board[1][x] == self.board[2][x] != ' ':
-                return self.board[0][x]
-        
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != ' ':
-            return self.board[0][0]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != ' ':
-            return self.board[0][2]
-        
+        for player, bits in self._get_bitboards().items():
+            if _has_line(bits):
+                return player
         return None
     
     def _calculate_score(self) -> int:
@@ -2,6 +2,7 @@
 
 import curses
 import random
+import string
 from typing import List, Set, Dict, Any
 from utils.base_game import BaseGame
 from utils.ui_helpers import draw_game_over_screen
@@ -25,15 +26,35 @@ class WordleGame(BaseGame):
         'FRAME', 'GRANT', 'HOOKS', 'IMAGE', 'JOINS',
     ]
     
+    KEYBOARD = ("QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM")
+    # How a keyboard letter is shown for each letter state
+    KEY_GLYPHS = {
+        'correct': "[{}]",
+        'present': " {} ",
+        'absent': "·{}·",
+        'unknown': " {} ",
+    }
+    # Every letter pre-rendered in every state; 'unknown' doubles as the
+    # plain cell used in the guess grid
+    LETTER_GLYPHS = {
+        state: {letter: glyph.format(letter) for letter in string.ascii_uppercase}
+        for state, glyph in KEY_GLYPHS.items()
+    }
+    
     def __init__(self):
         super().__init__('wordle', min_height=24, min_width=80)
         
         # Game state
         self.target_word = ''
+        self.target_letters = frozenset()
         self.guesses = []
+        # Per submitted guess, the (x offset, text, attr) cells to draw
+        self._guess_render = []
         self.current_guess = ''
         self.max_guesses = 6
         self.letter_states = {}  # Track letter colors
+        # Keyboard rows as drawn; rebuilt when letter_states changes
+        self._keyboard_rows = self._build_keyboard_rows()
         self.cursor_pos = 0
     
     def _get_input_timeout(self) -> int:
@@ -42,11 +63,23 @@ class WordleGame(BaseGame):
     def _init_game(self):
         """Initialize the game."""
         self.target_word = random.choice(self.WORDS).upper()
+        self.target_letters = frozenset(self.target_word)
         self.guesses = []
+        self._guess_render = []
         self.current_guess = ''
         self.letter_states = {}
+        self._keyboard_rows = self._build_keyboard_rows()
         self.cursor_pos = 0
     
+    def _build_keyboard_rows(self) -> List[str]:
+        """Render the keyboard rows with each letter's current state."""
+        glyphs = self.LETTER_GLYPHS
+        states = self.letter_states
+        return [
+            ''.join(glyphs[states.get(letter, 'unknown')][letter] for letter in row)
+            for row in self.KEYBOARD
+        ]
+    
     def _handle_input(self, key: int) -> bool:
         """Handle player input."""
         if key == ord('q'):
@@ -87,18 +120,27 @@ class WordleGame(BaseGame):
         guess = self.current_guess.upper()
         self.guesses.append(guess)
         
-        # Update letter states
+        # Update letter states and lay out the row once, since it never changes
+        target_letters = self.target_letters
+        correct_glyphs = self.LETTER_GLYPHS['correct']
+        plain_glyphs = self.LETTER_GLYPHS['unknown']
+        render = []
         for i, letter in enumerate(guess):
             target_letter = self.target_word[i]
             
             if letter == target_letter:
                 self.letter_states[letter] = 'correct'
-            elif letter in self.target_word:
+                render.append((i * 4, correct_glyphs[letter], curses.A_REVERSE | curses.A_BOLD))
+            elif letter in target_letters:
                 if self.letter_states.get(letter) != 'correct':
                     self.letter_states[letter] = 'present'
+                render.append((i * 4, plain_glyphs[letter], curses.A_BOLD))
             else:
                 if letter not in self.letter_states:
                     self.letter_states[letter] = 'absent'
+                render.append((i * 4, plain_glyphs[letter], curses.A_DIM))
+        self._guess_render.append(render)
+        self._keyboard_rows = self._build_keyboard_rows()
         
         # Check win condition
         if guess == self.target_word:
@@ -137,6 +179,7 @@ class WordleGame(BaseGame):
         self.stdscr.addstr(2, (self.width - len(subtitle)) // 2, subtitle)
         
         # Draw guesses
+        plain_glyphs = self.LETTER_GLYPHS['unknown']
         grid_start_y = 5
         grid_start_x = (self.width - 20) // 2
         
@@ -144,23 +187,10 @@ class WordleGame(BaseGame):
             y = grid_start_y + i * 2
             
             if i < len(self.guesses):
-                # Draw completed guess
-                guess = self.guesses[i]
-                for j, letter in enumerate(guess):
-                    x = grid_start_x + j * 4
-                    
-                    # Determine color/style
-                    if letter == self.target_word[j]:
-                        attr = curses.A_REVERSE | curses.A_BOLD  # Correct position
-                        display = f"[{letter}]"
-                    elif letter in self.target_word:
-                        attr = curses.A_BOLD  # Present but wrong position
-                        display = f" {letter} "
-                    else:
-                        attr = curses.A_DIM  # Not in word
-                        display = f" {letter} "
-                    
-                    self.stdscr.addstr(y, x, display, attr)
+                # Draw completed guess: correct position reversed, present
+                # bold, not in word dim
+                for dx, display, attr in self._guess_render[i]:
+                    self.stdscr.addstr(y, grid_start_x + dx, display, attr)
             
             elif i == len(self.guesses):
                 # Draw current guess being typed
@@ -168,7 +198,7 @@ class WordleGame(BaseGame):
                     x = grid_start_x + j * 4
                     if j < len(self.current_guess):
                         letter = self.current_guess[j]
-                        self.stdscr.addstr(y, x, f" {letter} ", curses.A_UNDERLINE)
+                        self.stdscr.addstr(y, x, plain_glyphs[letter], curses.A_UNDERLINE)
                     else:
                         self.stdscr.addstr(y, x, " _ ")
             
@@ -186,25 +216,7 @@ class WordleGame(BaseGame):
         
         # Keyboard (show letter states)
         keyboard_y = grid_start_y + self.max_guesses * 2 + 3
-        keyboard = [
-            "QWERTYUIOP",
-            "ASDFGHJKL",
-            "ZXCVBNM"
-        ]
-        
-        for row_idx, row in enumerate(keyboard):
-            row_text = ""
-            for letter in row:
-                state = self.letter_states.get(letter, 'unknown')
-                if state == 'correct':
-                    row_text += f"[{letter}]"
-                elif state == 'present':
-                    row_text += f" {letter} "
-                elif state == 'absent':
-                    row_text += f"·{letter}·"
-                else:
-                    row_text += f" {letter} "
-            
+        for row_idx, row_text in enumerate(self._keyboard_rows):
             x = (self.width - len(row_text)) // 2
             self.stdscr.addstr(keyboard_y + row_idx, x, row_text)
         
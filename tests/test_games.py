@@ -10,7 +10,12 @@ from games.battleship import BattleshipGame
 from games.conway import ConwayGame
 from games.asteroids import Asteroids
 from games.centipede import CentipedeGame
-from games.missile_command import MissileCommandGame
+from games.missile_command import MissileCommandGame, MissileColumns
+from games.minesweeper import MinesweeperGame, MINE
+from games.sudoku import SudokuGame
+from games.space_invaders import SpaceInvadersGame
+from games.pacman import (PacManGame, move_ghosts, OPEN_MASKS, MAZE_WIDTH,
+                          MAZE_HEIGHT, UP, DOWN, LEFT, RIGHT)
 
 
 class TestSnakeGame(unittest.TestCase):
@@ -26,6 +31,16 @@ class TestSnakeGame(unittest.TestCase):
         # Snake is initialized in _init_game, which requires curses
         # Just verify the game object was created
         self.assertIsNotNone(self.game)
+    
+    def test_occupancy_follows_moves(self):
+        """Test that the occupied cell set tracks the snake body."""
+        self.game.height, self.game.width = 24, 80
+        self.game.food = (1, 1)
+        self.game.last_move_time = self.game.game_speed
+        self.game._update_game(0)
+        self.assertEqual(self.game._occupied, set(self.game.snake))
+        self.assertEqual(self.game.snake[0], (11, 10))
+        self.assertNotIn((10, 8), self.game._occupied)
 
 
 class TestTetrisGame(unittest.TestCase):
@@ -41,6 +56,18 @@ class TestTetrisGame(unittest.TestCase):
         # Game state is initialized in _init_game, which requires curses
         # Just verify the game object was created
         self.assertIsNotNone(self.game)
+    
+    def test_clear_lines(self):
+        """Test that full rows are removed and the rows above drop."""
+        game = self.game
+        game.board[-1] = game.full_row
+        game.board[-2] = 0b1
+        game.board[-3] = game.full_row
+        game._clear_lines()
+        self.assertEqual(game.lines_cleared, 2)
+        self.assertEqual(game.score, 400)
+        self.assertEqual(game.board[-1], 0b1)
+        self.assertEqual(game.board[:-1], [0] * (game.board_height - 1))
 
 
 class TestTicTacToeGame(unittest.TestCase):
@@ -84,6 +111,17 @@ class TestTicTacToeGame(unittest.TestCase):
         ]
         winner = self.game._check_winner()
         self.assertEqual(winner, 'X')
+    
+    def test_best_move_wins_before_blocking(self):
+        """Test that the AI takes a winning move over a block."""
+        self.game.board = [
+            ['X', 'X', ' '],
+            [' ', 'O', 'O'],
+            [' ', ' ', ' ']
+        ]
+        self.assertEqual(self.game._get_best_move(), (1, 0))
+        self.game.board[1][2] = ' '
+        self.assertEqual(self.game._get_best_move(), (0, 2))
 
 
 class TestWordleGame(unittest.TestCase):
@@ -106,6 +144,17 @@ class TestWordleGame(unittest.TestCase):
         # This test checks the structure is correct
         self.assertTrue(hasattr(WordleGame, 'WORDS'))
         # Most tests would need curses initialization
+    
+    def test_submit_guess_letter_states(self):
+        """Test that a guess marks letters correct, present or absent."""
+        self.game.target_word = 'STACK'
+        self.game.target_letters = frozenset('STACK')
+        self.game.current_guess = 'SCOPE'
+        self.game._submit_guess()
+        self.assertEqual(self.game.letter_states['S'], 'correct')
+        self.assertEqual(self.game.letter_states['C'], 'present')
+        self.assertEqual(self.game.letter_states['O'], 'absent')
+        self.assertFalse(self.game.game_over)
 
 
 class TestConnectFourGame(unittest.TestCase):
@@ -200,8 +249,219 @@ class TestMissileCommandGame(unittest.TestCase):
         self.assertEqual(self.game.game_name, 'missile_command')
         self.assertEqual(len(self.game.bases), 3)
         self.assertEqual(len(self.game.cities), 6)
+    
+    def test_remove_indices(self):
+        """Test that removing missiles keeps the columns aligned."""
+        missiles = MissileColumns()
+        for i in range(5):
+            missiles.append(float(i), i * 2.0, 0.0, 0.0, i * 0.1, i * 0.2)
+        missiles.remove([3, 1, 3])
+        self.assertEqual(missiles.x, [0.0, 2.0, 4.0])
+        self.assertEqual(missiles.y, [0.0, 4.0, 8.0])
+        self.assertEqual(missiles.dy, [0.0, 0.4, 0.8])
+        self.assertEqual(len(missiles), 3)
+    
+    def test_explosion_destroys_missile(self):
+        """Test that an enemy missile inside a blast is destroyed and scored."""
+        game = self.game
+        game.explosions.append(30.0, 10.0)
+        game.explosions.radius[0] = 2.0
+        game.enemy_missiles.append(31.0, 10.0, 31.0, 19.0, 0.0, 0.0)
+        game.enemy_missiles.append(5.0, 5.0, 5.0, 19.0, 0.0, 0.0)
+        game._update_game(0)
+        self.assertEqual(game.score, 25)
+        self.assertEqual(game.enemy_missiles.x, [5.0])
+
+
+class TestMinesweeperGame(unittest.TestCase):
+    """Test MinesweeperGame functionality."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.game = MinesweeperGame()
+    
+    def test_initialization(self):
+        """Test game initialization."""
+        self.assertEqual(self.game.game_name, 'minesweeper')
+        self.assertEqual(len(self.game.grid), self.game.board_width * self.game.board_height)
+    
+    def test_place_mines(self):
+        """Test mine placement and adjacent counts."""
+        game = self.game
+        game._place_mines(0, 0)
+        self.assertEqual(game.grid.count(MINE), game.mine_count)
+        self.assertNotEqual(game.grid[0], MINE)
+        
+        for y in range(game.board_height):
+            for x in range(game.board_width):
+                if game.grid[y * game.board_width + x] == MINE:
+                    continue
+                expected = sum(
+                    1 for ny in range(y - 1, y + 2) for nx in range(x - 1, x + 2)
+                    if 0 <= ny < game.board_height and 0 <= nx < game.board_width
+                    and game.grid[ny * game.board_width + nx] == MINE
+                )
+                self.assertEqual(game.grid[y * game.board_width + x], expected)
+    
+    def test_reveal_flagged_cell(self):
+        """Test that flagged cells are not revealed."""
+        self.game.flagged[0] = 1
+        self.game._reveal_cell(0, 0)
+        self.assertEqual(self.game.revealed[0], 0)
+        self.assertEqual(self.game.cells_revealed, 0)
+
+
+class TestSudokuGame(unittest.TestCase):
+    """Test SudokuGame functionality."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.game = SudokuGame()
+    
+    def test_generate_puzzle(self):
+        """Test that the solution is valid and the puzzle matches it."""
+        game = self.game
+        game._generate_puzzle()
+        digits = set(range(1, 10))
+        solution = game.solution
+        for i in range(9):
+            self.assertEqual(set(solution[i * 9:i * 9 + 9]), digits)
+            self.assertEqual(set(solution[i::9]), digits)
+            box_row, box_col = 3 * (i // 3), 3 * (i % 3)
+            self.assertEqual({solution[(box_row + r) * 9 + box_col + c]
+                              for r in range(3) for c in range(3)}, digits)
+        
+        empty = 0
+        for cell in range(81):
+            if game.grid[cell] == 0:
+                empty += 1
+                self.assertFalse(game.fixed[cell])
+            else:
+                self.assertEqual(game.grid[cell], solution[cell])
+                self.assertTrue(game.fixed[cell])
+        self.assertEqual(empty, game.cells_to_remove)
+    
+    def test_complete_after_filling(self):
+        """Test that the puzzle completes once every cell matches."""
+        game = self.game
+        game._generate_puzzle()
+        empty = [cell for cell in range(81) if game.grid[cell] == 0]
+        wrong = game.solution[empty[0]] % 9 + 1
+        game._set_cell(empty[0], wrong)
+        for cell in empty[1:]:
+            game._set_cell(cell, game.solution[cell])
+        self.assertFalse(game._check_complete())
+        game._set_cell(empty[0], game.solution[empty[0]])
+        self.assertTrue(game._check_complete())
+
 
 
+
+class TestSpaceInvadersGame(unittest.TestCase):
+    """Test SpaceInvadersGame functionality."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.game = SpaceInvadersGame()
+        self.game._spawn_enemies()
+    
+    def test_bullet_kills_adjacent_enemy(self):
+        """Test that a bullet beside an enemy kills it and is used up."""
+        game = self.game
+        game.bullets_y.append(game.enemies_y[0])
+        game.bullets_x.append(game.enemies_x[0] + 1)
+        game._check_collisions()
+        self.assertFalse(game.enemies_alive[0])
+        self.assertTrue(all(game.enemies_alive[1:]))
+        self.assertEqual(game.bullets_y, [])
+        self.assertEqual(game.score, 10)
+    
+    def test_formation_turns_at_new_edge(self):
+        """Test that the span shrinks after the edge column dies."""
+        game = self.game
+        right = max(game.enemies_x)
+        self.assertEqual(game._get_enemy_span()[1], right)
+        
+        # Shoot out the rightmost column
+        for i, x in enumerate(game.enemies_x):
+            if x == right:
+                game.bullets_y.append(game.enemies_y[i])
+                game.bullets_x.append(x)
+        game._check_collisions()
+        new_right = game._get_enemy_span()[1]
+        self.assertEqual(new_right, right - 5)
+        
+        # March right until the new edge reaches the wall, then turn
+        steps = game.board_width - 2 - new_right
+        top = min(game.enemies_y)
+        for _ in range(steps):
+            game._move_enemies(game.enemy_speed)
+        self.assertEqual(game.enemy_direction, 1)
+        game._move_enemies(game.enemy_speed)
+        self.assertEqual(game.enemy_direction, -1)
+        self.assertEqual(min(game.enemies_y), top + 1)
+
+class TestPacManGame(unittest.TestCase):
+    """Test PacManGame functionality."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.game = PacManGame()
+        self.game._init_maze()
+    
+    def test_walls_block_movement(self):
+        """Test that Pac-Man does not move into a wall."""
+        game = self.game
+        game.pacman_pos = (1, 1)
+        for direction in (UP, LEFT):
+            game.pacman_dir = game.next_dir = direction
+            game._move_pacman()
+            self.assertEqual(game.pacman_pos, (1, 1))
+    
+    def test_maze_edges_do_not_wrap(self):
+        """Test that no move leads off the maze edge to the other side."""
+        for y in range(MAZE_HEIGHT):
+            self.assertFalse(OPEN_MASKS[y * MAZE_WIDTH] >> LEFT & 1)
+            self.assertFalse(OPEN_MASKS[y * MAZE_WIDTH + MAZE_WIDTH - 1] >> RIGHT & 1)
+        for x in range(MAZE_WIDTH):
+            self.assertFalse(OPEN_MASKS[x] >> UP & 1)
+            self.assertFalse(OPEN_MASKS[(MAZE_HEIGHT - 1) * MAZE_WIDTH + x] >> DOWN & 1)
+    
+    def test_eat_dot_and_power_pellet(self):
+        """Test that eating clears the cell and scores it."""
+        game = self.game
+        game.maze[1 * MAZE_WIDTH + 2] = 2
+        game.maze[1 * MAZE_WIDTH + 3] = 3
+        game.pacman_pos = (1, 1)
+        game.pacman_dir = game.next_dir = RIGHT
+        dots = game.dots_remaining
+        
+        game._move_pacman()
+        self.assertEqual(game.pacman_pos, (1, 2))
+        self.assertEqual(game.score, 10)
+        self.assertEqual(game.maze[1 * MAZE_WIDTH + 2], 0)
+        self.assertEqual(game.maze_row_strs[1][2], ' ')
+        
+        game._move_pacman()
+        self.assertEqual(game.score, 60)
+        self.assertEqual(game.dots_remaining, dots - 2)
+        self.assertEqual(game.power_pellet_time, 10.0)
+        self.assertTrue(all(game.ghost_frightened))
+    
+    def test_ghost_moves(self):
+        """Test that chasing ghosts close in and frightened ones stay off walls."""
+        gy, gx, gdir = [1], [3], [RIGHT]
+        move_ghosts(gy, gx, gdir, [False], 1, 1, [])
+        self.assertEqual((gy[0], gx[0], gdir[0]), (1, 2, LEFT))
+        
+        # From the corner only right and down are open
+        gy, gx = [1], [1]
+        move_ghosts(gy, gx, gdir, [True], 5, 5, [0.0])
+        self.assertEqual((gy[0], gx[0], gdir[0]), (2, 1, DOWN))
+        gy, gx = [1], [1]
+        move_ghosts(gy, gx, gdir, [True], 5, 5, [0.99])
+        self.assertEqual((gy[0], gx[0], gdir[0]), (1, 2, RIGHT))
+
 if __name__ == '__main__':
     unittest.main()
 
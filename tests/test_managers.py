@@ -1,5 +1,6 @@
 """Tests for manager classes."""
 
+import curses
 import unittest
 import tempfile
 import shutil
@@ -11,6 +12,7 @@ from utils.achievements import AchievementManager
 from utils.save_manager import SaveManager
 from utils.themes import ThemeManager
 from utils.daily_challenges import DailyChallengeManager
+from utils.frame_buffer import FrameBuffer
 
 
 class TestHighScoreManager(unittest.TestCase):
@@ -224,6 +226,58 @@ class TestDailyChallengeManager(unittest.TestCase):
         self.assertTrue(self.manager.is_completed(challenge_id))
 
 
+
+class RecordingWindow:
+    """Minimal stand-in for a curses window that records addstr calls."""
+    
+    def __init__(self):
+        self.writes = []
+    
+    def addstr(self, y, x, text, attr=0):
+        self.writes.append((y, x, text, attr))
+
+
+class TestFrameBuffer(unittest.TestCase):
+    """Test FrameBuffer diffing."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.frame = FrameBuffer(3, 10)
+        self.win = RecordingWindow()
+    
+    def test_first_flush_writes_every_row(self):
+        """Test that the first flush paints the whole buffer."""
+        self.frame.addstr(1, 2, "hi")
+        self.frame.flush(self.win)
+        self.assertEqual(len(self.win.writes), 3)
+        self.assertIn((1, 0, "  hi      ", 0), self.win.writes)
+    
+    def test_flush_writes_only_changes(self):
+        """Test that later flushes only send changed runs."""
+        self.frame.addstr(1, 2, "hi")
+        self.frame.flush(self.win)
+        self.win.writes = []
+        
+        self.frame.begin_frame()
+        self.frame.addstr(1, 3, "i!")
+        self.frame.flush(self.win)
+        self.assertEqual(self.win.writes, [(1, 2, " ", 0), (1, 4, "!", 0)])
+        
+        self.win.writes = []
+        self.frame.flush(self.win)
+        self.assertEqual(self.win.writes, [])
+    
+    def test_blanks_join_bold_runs(self):
+        """Test that blanks between bold cells do not split the run."""
+        self.frame.addstr(0, 0, "^   ^", curses.A_BOLD)
+        self.frame.chgat(0, 1, 3, curses.A_NORMAL)
+        self.frame.addstr(1, 0, "a b", curses.A_REVERSE)
+        self.frame.chgat(1, 1, 1, curses.A_NORMAL)
+        self.frame.flush(self.win)
+        self.assertEqual(self.win.writes[0], (0, 0, "^   ^     ", curses.A_BOLD))
+        self.assertEqual(self.win.writes[1], (1, 0, "a", curses.A_REVERSE))
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -10,6 +10,7 @@ from utils.statistics import StatisticsManager
 from utils.achievements import AchievementManager
 from utils.themes import ThemeManager
 from utils.save_manager import SaveManager
+from utils.frame_buffer import FrameBuffer
 from utils.terminal import validate_terminal_size, TerminalSizeError, show_terminal_size_error
 
 
@@ -24,6 +25,13 @@ class BaseGame(ABC):
     - High score management
     """
     
+    # Longest frame time passed to _update_game, so a stall (suspend,
+    # debugger) does not make fixed-step games run a burst of catch-up steps.
+    # An idle frame is the getch timeout (up to 150ms in Pac-Man) plus the
+    # 10ms sleep and the draw; the cap sits well above that so normal frames
+    # are credited in full and timers keep real time.
+    MAX_FRAME_DELTA = 0.25
+    
     def __init__(self, game_name: str, min_height: int = 24, min_width: int = 80):
         """Initialize base game.
         
@@ -65,6 +73,10 @@ class BaseGame(ABC):
         self.height = 0
         self.width = 0
         
+        # Diffed drawing (see _begin_frame)
+        self._frame: Optional[FrameBuffer] = None
+        self._frame_overlay = False
+        
         # Timing
         self.game_start_time = None
         self.last_frame_time = None
@@ -133,36 +145,71 @@ class BaseGame(ABC):
         """Draw the game. Called each frame."""
         pass
     
-    def _draw_pause_message(self):
-        """Draw pause message overlay."""
+    def _begin_frame(self) -> FrameBuffer:
+        """Start a diffed frame and return the buffer to draw it into.
+        
+        Draw the frame into the returned buffer, then call _end_frame().
+        Achievement notifications are drawn
+        straight onto the screen after _draw_game, so the buffer repaints
+        everything while one is showing and once after it goes away.
+        """
+        if self._frame is None or self._frame.getmaxyx() != (self.height, self.width):
+            self._frame = FrameBuffer(self.height, self.width)
+        overlay = bool(self.pending_achievements)
+        if overlay or self._frame_overlay:
+            self._frame.invalidate()
+        self._frame_overlay = overlay
+        self._frame.begin_frame()
+        return self._frame
+    
+    def _end_frame(self):
+        """Write the changed cells of the current frame and update the terminal.
+        
+        Uses noutrefresh plus a single doupdate so curses sends one batch of
+        output per frame.
+        """
+        self._frame.flush(self.stdscr)
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+    
+    def _draw_pause_message(self, win=None):
+        """Draw pause message overlay.
+        
+        Args:
+            win: Window or frame buffer to draw into (defaults to stdscr)
+        """
         if self.paused:
+            win = win or self.stdscr
             pause_msg = "PAUSED - Press P to resume"
             msg_x = (self.width - len(pause_msg)) // 2
             msg_y = self.height // 2
-            self.stdscr.addstr(msg_y, msg_x, pause_msg, 
-                             curses.A_BOLD | curses.A_REVERSE)
+            win.addstr(msg_y, msg_x, pause_msg, 
+                       curses.A_BOLD | curses.A_REVERSE)
     
-    def _draw_info_bar(self, extra_info: Optional[Dict[str, Any]] = None):
+    def _draw_info_bar(self, extra_info: Optional[Dict[str, Any]] = None, win=None):
         """Draw info bar with score and high score.
         
         Args:
             extra_info: Optional dict of additional info to display
+            win: Window or frame buffer to draw into (defaults to stdscr)
         """
+        win = win or self.stdscr
+        
         # Score
         score_text = f"Score: {self.score}"
-        self.stdscr.addstr(0, 2, score_text)
+        win.addstr(0, 2, score_text)
         
         # High score
         if self.high_score is not None and self.settings.get('general', 'show_high_scores', True):
             high_text = f"High: {self.high_score}"
-            self.stdscr.addstr(0, self.width - len(high_text) - 2, high_text)
+            win.addstr(0, self.width - len(high_text) - 2, high_text)
         
         # Extra info
         if extra_info:
             x = 2
             for key, value in extra_info.items():
                 info_text = f"{key}: {value}"
-                self.stdscr.addstr(1, x, info_text)
+                win.addstr(1, x, info_text)
                 x += len(info_text) + 3
     
     def _get_game_state(self) -> Dict[str, Any]:
@@ -278,7 +325,7 @@ class BaseGame(ABC):
             # Game loop
             while not self.game_over:
                 current_time = time.time()
-                delta_time = current_time - self.last_frame_time
+                delta_time = min(current_time - self.last_frame_time, self.MAX_FRAME_DELTA)
                 self.last_frame_time = current_time
                 
                 # Handle input
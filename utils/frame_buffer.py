@@ -0,0 +1,118 @@
+"""Off-screen frame buffer that only writes changed cells to curses."""
+
+import curses
+from typing import List, Optional, Tuple
+
+# A screen cell: (character, curses attribute)
+Cell = Tuple[str, int]
+
+
+class FrameBuffer:
+    """Back buffer of (char, attr) cells diffed against the last flush.
+
+    Games draw a whole frame into the buffer with the window-style addstr,
+    addch, chgat and border calls, then flush() it to the real window. Each
+    row is compared with what the previous flush wrote and only runs of
+    changed cells sharing one attribute are sent to curses, so a frame where
+    a few sprites moved costs a few writes instead of clear() plus a repaint.
+    """
+
+    BLANK: Cell = (' ', curses.A_NORMAL)
+    # Attributes that do not change how a blank cell looks, so blanks with
+    # any mix of them can share a run instead of forcing an attribute switch
+    BLANK_INVISIBLE_ATTRS = curses.A_BOLD | curses.A_DIM
+
+    def __init__(self, height: int, width: int):
+        self.height = height
+        self.width = width
+        self._blank_row = [self.BLANK] * width
+        self._back = [list(self._blank_row) for _ in range(height)]
+        # Rows as last written to the screen; None means unknown
+        self._front: List[Optional[List[Cell]]] = [None] * height
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    def invalidate(self):
+        """Forget what is on screen so the next flush repaints every cell."""
+        self._front = [None] * self.height
+
+    def begin_frame(self):
+        """Reset the back buffer to blanks before drawing a new frame."""
+        for row in self._back:
+            row[:] = self._blank_row
+
+    def addstr(self, y: int, x: int, text: str, attr: int = curses.A_NORMAL):
+        """Draw text into the back buffer, clipped to the buffer edges."""
+        if not 0 <= y < self.height:
+            return
+        start = max(x, 0)
+        end = min(x + len(text), self.width)
+        if start < end:
+            self._back[y][start:end] = [(ch, attr) for ch in text[start - x:end - x]]
+
+    def addch(self, y: int, x: int, ch, attr: int = curses.A_NORMAL):
+        """Draw a single character into the back buffer."""
+        if 0 <= y < self.height and 0 <= x < self.width:
+            self._back[y][x] = (ch if isinstance(ch, str) else chr(ch), attr)
+
+    def chgat(self, y: int, x: int, num: int, attr: int):
+        """Set the attribute of num cells starting at (y, x)."""
+        if not 0 <= y < self.height:
+            return
+        row = self._back[y]
+        for i in range(max(x, 0), min(x + num, self.width)):
+            row[i] = (row[i][0], attr)
+
+    def vline(self, y: int, x: int, ch, n: int, attr: int = curses.A_NORMAL):
+        """Draw a vertical line of n characters starting at (y, x)."""
+        for row in range(max(y, 0), min(y + n, self.height)):
+            self.addch(row, x, ch, attr)
+
+    def border(self):
+        """Draw a box around the buffer edges with line-drawing characters."""
+        inner = self.width - 2
+        self.addstr(0, 0, '┌' + '─' * inner + '┐')
+        for y in range(1, self.height - 1):
+            self.addch(y, 0, '│')
+            self.addch(y, self.width - 1, '│')
+        self.addstr(self.height - 1, 0, '└' + '─' * inner + '┘')
+
+    def flush(self, win):
+        """Write cells that changed since the last flush to win."""
+        width = self.width
+        last_row = self.height - 1
+        invisible = self.BLANK_INVISIBLE_ATTRS
+        for y in range(self.height):
+            back = self._back[y]
+            front = self._front[y]
+            if back == front:
+                continue
+            x = 0
+            while x < width:
+                cell = back[x]
+                if front is not None and cell == front[x]:
+                    x += 1
+                    continue
+                # Extend the run while cells differ and share an attribute;
+                # blanks join a bold or dim run since they look the same
+                start = x
+                attr = cell[1]
+                chars = [cell[0]]
+                x += 1
+                while x < width:
+                    cell = back[x]
+                    if front is not None and cell == front[x]:
+                        break
+                    if cell[1] != attr and (cell[0] != ' ' or
+                                            (cell[1] | attr) & ~invisible):
+                        break
+                    chars.append(cell[0])
+                    x += 1
+                try:
+                    win.addstr(y, start, ''.join(chars), attr)
+                except curses.error:
+                    # Writing the bottom-right cell works but reports an error
+                    if not (y == last_row and x == width):
+                        raise
+            self._front[y] = list(back)
@@ -5,6 +5,17 @@ import os
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
+def _format_timestamp(iso_timestamp: str) -> str:
+    """Format an ISO timestamp for display (memoized)."""
+    try:
+        dt = datetime.fromisoformat(iso_timestamp)
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError, AttributeError):
+        return "Unknown"
 
 
 class SaveManager:
@@ -193,11 +204,7 @@ class SaveManager:
         Returns:
             Formatted date/time string
         """
-        try:
-            dt = datetime.fromisoformat(iso_timestamp)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, AttributeError):
-            return "Unknown"
+        return _format_timestamp(iso_timestamp)
     
     def auto_save(self, game_name: str, game_state: Dict[str, Any],
                   metadata: Optional[Dict[str, Any]] = None) -> bool:
@@ -1,6 +1,9 @@
 """Terminal utilities and validation."""
 
 import curses
+import io
+import sys
+from contextlib import contextmanager
 from typing import Tuple, Optional
 
 
@@ -9,6 +12,33 @@ class TerminalSizeError(Exception):
     pass
 
 
+@contextmanager
+def buffer_stdout():
+    """Block-buffer sys.stdout for the duration of a curses session.
+    
+    Stray writes from Python code (such as save error messages) are then
+    flushed in one chunk instead of line by line between screen updates.
+    The original buffering is restored on exit.
+    """
+    stdout = sys.stdout
+    reconfigure = getattr(stdout, 'reconfigure', None)
+    saved = None
+    if reconfigure is not None:
+        try:
+            saved = (stdout.line_buffering, stdout.write_through)
+            reconfigure(line_buffering=False, write_through=False)
+        except (AttributeError, ValueError, io.UnsupportedOperation):
+            saved = None
+    try:
+        yield
+    finally:
+        if saved is not None:
+            try:
+                reconfigure(line_buffering=saved[0], write_through=saved[1])
+            except (ValueError, io.UnsupportedOperation):
+                pass
+
+
 def validate_terminal_size(min_height: int, min_width: int, 
                           stdscr: Optional[curses.window] = None) -> Tuple[int, int]:
     """Validate terminal size and return current dimensions.
@@ -1,12 +1,17 @@
 """Shared UI helper functions for games."""
 
 import curses
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
 
+@lru_cache(maxsize=256)
 def center_text(text: str, width: int) -> int:
     """Calculate x position to center text.
     
+    Results are memoized, since menus re-center the same strings at the
+    same width on every repaint.
+    
     Args:
         text: Text to center
         width: Total width available